@@ -2,6 +2,8 @@
 
 pragma solidity ^0.8.0;
 
+import "./PackedCalldata.sol";
+
 contract Classroom {
     address public owner;
     struct Student {
@@ -10,26 +12,40 @@ contract Classroom {
         uint256 age;
         string usn;
         string department;
-        string[] subjects;
+        uint256 subjectMask;
         bool isEnrolled;
         string teacherName;
         string suspensionReason;
         uint256 suspensionTimestamp;
         uint256 suspensionDuration;
+        // Set for students added through addStudentRecordToList, whose email, department and
+        // teacher name live off-chain under this keccak256 content hash (scripts/record_store.py)
+        bytes32 recordHash;
     }
     Student public student;
-    Student[] public students;
+    // Only the first studentCount entries are live; clearing the list just resets the
+    // count and later additions overwrite the old slots in place. Read through students(),
+    // which rejects the stale slots past the count.
+    Student[] private studentList;
+    uint256 private studentCount;
+    uint256 private studentEpoch;
+    // 1-based positions in `studentList`, keyed by keccak256 of the name / USN
+    mapping(bytes32 => uint256) private studentPositionByName;
+    mapping(bytes32 => uint256) private studentPositionByUSN;
 
     struct Teacher {
         string name;
         string emailId;
         uint256 age;
         string department;
-        string[] subjects;
+        uint256 subjectMask;
         bool isHired;
     }
     Teacher public teacher;
-    Teacher[] public teachers;
+    // Same lazy-clear scheme as `studentList`, read through teachers()
+    Teacher[] private teacherList;
+    uint256 private teacherCount;
+    uint256 private teacherEpoch;
 
 
     struct Department {
@@ -39,11 +55,23 @@ contract Classroom {
         uint256 numberOfTeachers;
         string[] subjectsOffered;
         bool isActive;
-        Student[] students;
-        Teacher[] teachers;
     }
     Department public department;
 
+    // Subject interning table: each distinct subject name is stored once and
+    // students/teachers keep a bitmask of subject IDs (at most 256 subjects).
+    // Only the owner can add entries, so other callers cannot fill the table.
+    string[] private subjectNames;
+    mapping(bytes32 => uint256) private subjectIdPlusOne;
+    // Bumped on every registerDepartment so membership from a deactivated department is ignored
+    uint256 private departmentGeneration;
+    // Member ID lists and their 1-based positions, keyed by (departmentGeneration, list epoch).
+    // IDs are list slots, which are reused after a clear, so a clear also starts a fresh membership.
+    mapping(bytes32 => uint256[]) private departmentStudentIds;
+    mapping(bytes32 => mapping(uint256 => uint256)) private departmentStudentPosition;
+    mapping(bytes32 => uint256[]) private departmentTeacherIds;
+    mapping(bytes32 => mapping(uint256 => uint256)) private departmentTeacherPosition;
+
 
 
     function registerStudent(string memory _name, string memory _emailId, uint256 _age, string memory _usn, string memory _department, string[] memory _subjects, string memory _teacherName) public {
@@ -54,12 +82,13 @@ contract Classroom {
             age: _age,
             usn: _usn,
             department: _department,
-            subjects: _subjects,
+            subjectMask: _encodeSubjects(_subjects),
             isEnrolled: true,
             teacherName: _teacherName,
             suspensionReason: "",
             suspensionTimestamp: 0,
-            suspensionDuration: 0
+            suspensionDuration: 0,
+            recordHash: bytes32(0)
         });
     }
 
@@ -111,14 +140,11 @@ contract Classroom {
         }
         
         // Check students in the list
-        for (uint256 i = 0; i < students.length; i++) {
-            if (keccak256(abi.encodePacked(students[i].name)) == keccak256(abi.encodePacked(_name))) {
-                bool isSuspended = !students[i].isEnrolled && block.timestamp < students[i].suspensionTimestamp + students[i].suspensionDuration;
-                return (isSuspended, students[i].suspensionReason, students[i].suspensionTimestamp, students[i].suspensionDuration);
-            }
-        }
-        
-        revert("Student not found");
+        uint256 position = _studentPosition(studentPositionByName, keccak256(abi.encodePacked(_name)), false);
+        require(position != 0, "Student not found");
+        Student storage listed = studentList[position - 1];
+        bool listedSuspended = !listed.isEnrolled && block.timestamp < listed.suspensionTimestamp + listed.suspensionDuration;
+        return (listedSuspended, listed.suspensionReason, listed.suspensionTimestamp, listed.suspensionDuration);
     }
 
     function checkStudentSuspensionByUSN(string memory _usn) public view returns (bool, string memory, uint256, uint256) {
@@ -129,14 +155,35 @@ contract Classroom {
         }
         
         // Check students in the list
-        for (uint256 i = 0; i < students.length; i++) {
-            if (keccak256(abi.encodePacked(students[i].usn)) == keccak256(abi.encodePacked(_usn))) {
-                bool isSuspended = !students[i].isEnrolled && block.timestamp < students[i].suspensionTimestamp + students[i].suspensionDuration;
-                return (isSuspended, students[i].suspensionReason, students[i].suspensionTimestamp, students[i].suspensionDuration);
-            }
+        uint256 position = _studentPosition(studentPositionByUSN, keccak256(abi.encodePacked(_usn)), true);
+        require(position != 0, "Student not found");
+        Student storage listed = studentList[position - 1];
+        bool listedSuspended = !listed.isEnrolled && block.timestamp < listed.suspensionTimestamp + listed.suspensionDuration;
+        return (listedSuspended, listed.suspensionReason, listed.suspensionTimestamp, listed.suspensionDuration);
+    }
+
+    // Returns the 1-based position of the indexed student, or 0 when the entry is missing
+    // or stale (the list was cleared, so the slot is past studentCount or now holds someone else).
+    function _studentPosition(mapping(bytes32 => uint256) storage _positions, bytes32 _key, bool _byUSN) internal view returns (uint256) {
+        uint256 position = _positions[_key];
+        if (position == 0 || position > studentCount) {
+            return 0;
+        }
+        Student storage listed = studentList[position - 1];
+        bytes32 storedKey = _byUSN ? keccak256(abi.encodePacked(listed.usn)) : keccak256(abi.encodePacked(listed.name));
+        return storedKey == _key ? position : 0;
+    }
+
+    // Keeps the first live match for each key, matching the order the old linear scan returned.
+    function _indexStudent(uint256 _position, string memory _name, string memory _usn) internal {
+        bytes32 nameKey = keccak256(abi.encodePacked(_name));
+        if (_studentPosition(studentPositionByName, nameKey, false) == 0) {
+            studentPositionByName[nameKey] = _position;
+        }
+        bytes32 usnKey = keccak256(abi.encodePacked(_usn));
+        if (_studentPosition(studentPositionByUSN, usnKey, true) == 0) {
+            studentPositionByUSN[usnKey] = _position;
         }
-        
-        revert("Student not found");
     }
 
     constructor() {
@@ -149,7 +196,7 @@ contract Classroom {
             emailId: _emailId,
             age: _age,
             department: _department,
-            subjects: _subjects,
+            subjectMask: _encodeSubjects(_subjects),
             isHired: true
         });
     }
@@ -172,38 +219,117 @@ contract Classroom {
             emailId: _emailId,
             age: _age,
             department: _department,
-            subjects: _subjects,
+            subjectMask: _encodeSubjects(_subjects),
             isHired: true
         });
     }
 
 
-    function registerDepartment(string memory _name, string memory _hodName, uint256 _numberOfStudents, uint256 _numberOfTeachers, string[] memory _subjectsOffered, Student[] memory _students, Teacher[] memory _teachers) public {
+    function registerDepartment(string memory _name, string memory _hodName, uint256 _numberOfStudents, uint256 _numberOfTeachers, string[] memory _subjectsOffered, uint256[] memory _studentIds, uint256[] memory _teacherIds) public {
         require(!department.isActive, "A department is already registered.");
+        departmentGeneration += 1;
         department = Department({
             name: _name,
             hodName: _hodName,
             numberOfStudents: _numberOfStudents,
             numberOfTeachers: _numberOfTeachers,
             subjectsOffered: _subjectsOffered,
-            students: _students,
-            teachers: _teachers,
             isActive: true
         });
+        for (uint256 i = 0; i < _studentIds.length; i++) {
+            addStudentToDepartment(_studentIds[i]);
+        }
+        for (uint256 i = 0; i < _teacherIds.length; i++) {
+            addTeacherToDepartment(_teacherIds[i]);
+        }
     }
 
-    function getDepartmentDetails() public view returns (string memory, string memory, uint256, uint256, Student[] memory, Teacher[] memory) {
+    function getDepartmentDetails() public view returns (string memory, string memory, uint256, uint256, uint256, uint256) {
         require(department.isActive, "No department is currently registered.");
-        return (department.name, department.hodName, department.numberOfStudents, department.numberOfTeachers, department.students, department.teachers);
+        return (department.name, department.hodName, department.numberOfStudents, department.numberOfTeachers, departmentStudentIds[_studentMembership()].length, departmentTeacherIds[_teacherMembership()].length);
     }
-    function updateDepartmentDetails(string memory _name, string memory _hodName, uint256 _numberOfStudents, uint256 _numberOfTeachers, Student[] memory _students, Teacher[] memory _teachers) public {
+    function updateDepartmentDetails(string memory _name, string memory _hodName, uint256 _numberOfStudents, uint256 _numberOfTeachers) public {
         require(department.isActive, "No department is currently registered.");
         department.name = _name;
         department.hodName = _hodName;
         department.numberOfStudents = _numberOfStudents;
         department.numberOfTeachers = _numberOfTeachers;
-        department.students = _students;
-        department.teachers = _teachers;
+    }
+
+    // Department members are IDs: a student ID is its index in `studentList`, a teacher ID its index in `teacherList`.
+    function addStudentToDepartment(uint256 _studentId) public {
+        require(department.isActive, "No department is currently registered.");
+        require(_studentId < studentCount, "Student does not exist.");
+        bytes32 membership = _studentMembership();
+        mapping(uint256 => uint256) storage positions = departmentStudentPosition[membership];
+        require(positions[_studentId] == 0, "Student is already in the department.");
+        departmentStudentIds[membership].push(_studentId);
+        positions[_studentId] = departmentStudentIds[membership].length;
+    }
+
+    function removeStudentFromDepartment(uint256 _studentId) public {
+        require(department.isActive, "No department is currently registered.");
+        bytes32 membership = _studentMembership();
+        _removeMember(departmentStudentIds[membership], departmentStudentPosition[membership], _studentId);
+    }
+
+    function addTeacherToDepartment(uint256 _teacherId) public {
+        require(department.isActive, "No department is currently registered.");
+        require(_teacherId < teacherCount, "Teacher does not exist.");
+        bytes32 membership = _teacherMembership();
+        mapping(uint256 => uint256) storage positions = departmentTeacherPosition[membership];
+        require(positions[_teacherId] == 0, "Teacher is already in the department.");
+        departmentTeacherIds[membership].push(_teacherId);
+        positions[_teacherId] = departmentTeacherIds[membership].length;
+    }
+
+    function removeTeacherFromDepartment(uint256 _teacherId) public {
+        require(department.isActive, "No department is currently registered.");
+        bytes32 membership = _teacherMembership();
+        _removeMember(departmentTeacherIds[membership], departmentTeacherPosition[membership], _teacherId);
+    }
+
+    function getDepartmentMembers(uint256 offset, uint256 limit) public view returns (uint256[] memory) {
+        require(department.isActive, "No department is currently registered.");
+        return _page(departmentStudentIds[_studentMembership()], offset, limit);
+    }
+
+    function getDepartmentTeachers(uint256 offset, uint256 limit) public view returns (uint256[] memory) {
+        require(department.isActive, "No department is currently registered.");
+        return _page(departmentTeacherIds[_teacherMembership()], offset, limit);
+    }
+
+    function _studentMembership() internal view returns (bytes32) {
+        return keccak256(abi.encode(departmentGeneration, studentEpoch));
+    }
+
+    function _teacherMembership() internal view returns (bytes32) {
+        return keccak256(abi.encode(departmentGeneration, teacherEpoch));
+    }
+
+    // Swap-and-pop removal: the last member takes the removed member's place.
+    function _removeMember(uint256[] storage _ids, mapping(uint256 => uint256) storage _positions, uint256 _id) internal {
+        uint256 position = _positions[_id];
+        require(position != 0, "Not a member of the department.");
+        uint256 lastId = _ids[_ids.length - 1];
+        _ids[position - 1] = lastId;
+        _positions[lastId] = position;
+        _ids.pop();
+        delete _positions[_id];
+    }
+
+    function _page(uint256[] storage _ids, uint256 _offset, uint256 _limit) internal view returns (uint256[] memory page) {
+        uint256 total = _ids.length;
+        if (_offset >= total) {
+            return new uint256[](0);
+        }
+        if (_limit > total - _offset) {
+            _limit = total - _offset;
+        }
+        page = new uint256[](_limit);
+        for (uint256 i = 0; i < _limit; i++) {
+            page[i] = _ids[_offset + i];
+        }
     }
 
     function deactivateDepartment() public {
@@ -216,31 +342,110 @@ contract Classroom {
         return department.isActive;
     }
 
+    function students(uint256 _index) public view returns (string memory, string memory, uint256, string memory, string memory, uint256, bool, string memory, string memory, uint256, uint256, bytes32) {
+        require(_index < studentCount, "Student does not exist.");
+        Student storage listed = studentList[_index];
+        return (
+            listed.name, listed.emailId, listed.age, listed.usn, listed.department, listed.subjectMask, listed.isEnrolled,
+            listed.teacherName, listed.suspensionReason, listed.suspensionTimestamp, listed.suspensionDuration, listed.recordHash
+        );
+    }
+
+    function teachers(uint256 _index) public view returns (string memory, string memory, uint256, string memory, uint256, bool) {
+        require(_index < teacherCount, "Teacher does not exist.");
+        Teacher storage listed = teacherList[_index];
+        return (listed.name, listed.emailId, listed.age, listed.department, listed.subjectMask, listed.isHired);
+    }
+
     function getStudentCount() public view returns (uint256) {
-        return students.length;
+        return studentCount;
     }
     function getTeacherCount() public view returns (uint256) {
-        return teachers.length;
+        return teacherCount;
     }
     function getDepartmentCount() public pure returns (uint256) {
         return 1; // Since only one department can be registered in this contract
     }
 
     function addStudentToList(string memory _name, string memory _emailId, uint256 _age, string memory _usn, string memory _department, string[] memory _subjects, string memory _teacherName) public {
+        _addStudent(_name, _emailId, _age, _usn, _department, _subjects, _teacherName, bytes32(0));
+    }
+
+    // Packed-calldata variants of registerStudent / addStudentToList. The payload is age (1 byte),
+    // then name, emailId, usn, department and teacherName, each as a 1-byte length and its UTF-8
+    // bytes, then a 1-byte subject count and each subject the same way (see scripts/packed_calldata.py).
+    function registerStudentPacked(bytes calldata _payload) public {
+        (string memory name, string memory emailId, uint256 age, string memory usn, string memory departmentName, string[] memory subjects, string memory teacherName) = _decodeStudentPayload(_payload);
+        registerStudent(name, emailId, age, usn, departmentName, subjects, teacherName);
+    }
+
+    function addStudentToListPacked(bytes calldata _payload) public {
+        (string memory name, string memory emailId, uint256 age, string memory usn, string memory departmentName, string[] memory subjects, string memory teacherName) = _decodeStudentPayload(_payload);
+        _addStudent(name, emailId, age, usn, departmentName, subjects, teacherName, bytes32(0));
+    }
+
+    function _decodeStudentPayload(bytes calldata _payload) internal pure returns (string memory name, string memory emailId, uint256 age, string memory usn, string memory departmentName, string[] memory subjects, string memory teacherName) {
+        require(_payload.length > 0, "Malformed payload.");
+        uint256 offset;
+        (age, offset) = PackedCalldata.readUint8(_payload, 0);
+        (name, offset) = PackedCalldata.readString(_payload, offset);
+        (emailId, offset) = PackedCalldata.readString(_payload, offset);
+        (usn, offset) = PackedCalldata.readString(_payload, offset);
+        (departmentName, offset) = PackedCalldata.readString(_payload, offset);
+        (teacherName, offset) = PackedCalldata.readString(_payload, offset);
+        uint256 subjectCount;
+        (subjectCount, offset) = PackedCalldata.readUint8(_payload, offset);
+        subjects = new string[](subjectCount);
+        for (uint256 i = 0; i < subjectCount; i++) {
+            (subjects[i], offset) = PackedCalldata.readString(_payload, offset);
+        }
+        require(offset == _payload.length, "Malformed payload.");
+    }
+
+    function addStudentRecordToList(string memory _name, uint256 _age, string memory _usn, string[] memory _subjects, bytes32 _recordHash) public {
+        require(_recordHash != bytes32(0), "Record hash required.");
+        _addStudent(_name, "", _age, _usn, "", _subjects, "", _recordHash);
+    }
+
+    function getStudentRecordHash(uint256 _studentId) public view returns (bytes32) {
+        require(_studentId < studentCount, "Student does not exist.");
+        return studentList[_studentId].recordHash;
+    }
+
+    function addStudentsBatch(string[] memory _names, string[] memory _emailIds, uint256[] memory _ages, string[] memory _usns, string[] memory _departments, string[][] memory _subjects, string[] memory _teacherNames) public {
+        uint256 count = _names.length;
+        require(
+            _emailIds.length == count && _ages.length == count && _usns.length == count &&
+            _departments.length == count && _subjects.length == count && _teacherNames.length == count,
+            "Batch arrays must have the same length."
+        );
+        for (uint256 i = 0; i < count; i++) {
+            _addStudent(_names[i], _emailIds[i], _ages[i], _usns[i], _departments[i], _subjects[i], _teacherNames[i], bytes32(0));
+        }
+    }
+
+    function _addStudent(string memory _name, string memory _emailId, uint256 _age, string memory _usn, string memory _department, string[] memory _subjects, string memory _teacherName, bytes32 _recordHash) internal {
         Student memory newStudent = Student({
             name: _name,
             emailId: _emailId,
             age: _age,
             usn: _usn,
             department: _department,
-            subjects: _subjects,
+            subjectMask: _encodeSubjects(_subjects),
             isEnrolled: true,
             teacherName: _teacherName,
             suspensionReason: "",
             suspensionTimestamp: 0,
-            suspensionDuration: 0
+            suspensionDuration: 0,
+            recordHash: _recordHash
         });
-        students.push(newStudent);
+        if (studentCount < studentList.length) {
+            studentList[studentCount] = newStudent;
+        } else {
+            studentList.push(newStudent);
+        }
+        studentCount += 1;
+        _indexStudent(studentCount, _name, _usn);
     }
     function addTeacherToList(string memory _name, string memory _emailId, uint256 _age, string memory _department, string[] memory _subjects) public {
         Teacher memory newTeacher = Teacher({
@@ -248,20 +453,27 @@ contract Classroom {
             emailId: _emailId,
             age: _age,
             department: _department,
-            subjects: _subjects,
+            subjectMask: _encodeSubjects(_subjects),
             isHired: true
         });
-        teachers.push(newTeacher);
+        if (teacherCount < teacherList.length) {
+            teacherList[teacherCount] = newTeacher;
+        } else {
+            teacherList.push(newTeacher);
+        }
+        teacherCount += 1;
     }
 
     function clearStudentList() public {
         require(msg.sender == owner, "Only the contract owner can clear the student list.");
-        delete students;
+        studentCount = 0;
+        studentEpoch += 1;
     }
 
     function clearTeacherList() public {
         require(msg.sender == owner, "Only the contract owner can clear the teacher list.");
-        delete teachers;
+        teacherCount = 0;
+        teacherEpoch += 1;
     }
 
 
@@ -293,11 +505,80 @@ contract Classroom {
 
     function getTeacherSubjects() public view returns (string[] memory) {
         require(teacher.isHired, "No teacher is currently registered.");
-        return teacher.subjects;
+        return _decodeSubjects(teacher.subjectMask);
     }
     function getStudentSubjects() public view returns (string[] memory) {
         require(student.isEnrolled, "No student is currently registered.");
-        return student.subjects;
+        return _decodeSubjects(student.subjectMask);
+    }
+
+    function getStudentSubjectMask() public view returns (uint256) {
+        require(student.isEnrolled, "No student is currently registered.");
+        return student.subjectMask;
+    }
+
+    function getTeacherSubjectMask() public view returns (uint256) {
+        require(teacher.isHired, "No teacher is currently registered.");
+        return teacher.subjectMask;
+    }
+
+    function registerSubject(string memory _name) public returns (uint256) {
+        require(msg.sender == owner, "Only the contract owner can register a subject.");
+        return _internSubject(_name);
+    }
+
+    function getSubjectCount() public view returns (uint256) {
+        return subjectNames.length;
+    }
+
+    function getSubjectNames(uint256 offset, uint256 limit) public view returns (string[] memory names) {
+        uint256 total = subjectNames.length;
+        if (offset >= total) {
+            return new string[](0);
+        }
+        if (limit > total - offset) {
+            limit = total - offset;
+        }
+        names = new string[](limit);
+        for (uint256 i = 0; i < limit; i++) {
+            names[i] = subjectNames[offset + i];
+        }
+    }
+
+    // Returns the subject's ID, adding it to the table the first time the owner uses it.
+    function _internSubject(string memory _name) internal returns (uint256) {
+        bytes32 key = keccak256(abi.encodePacked(_name));
+        uint256 idPlusOne = subjectIdPlusOne[key];
+        if (idPlusOne != 0) {
+            return idPlusOne - 1;
+        }
+        require(msg.sender == owner, "Unknown subject; only the contract owner can add new subjects.");
+        require(subjectNames.length < 256, "Subject table is full.");
+        subjectNames.push(_name);
+        subjectIdPlusOne[key] = subjectNames.length;
+        return subjectNames.length - 1;
+    }
+
+    function _encodeSubjects(string[] memory _subjects) internal returns (uint256 mask) {
+        for (uint256 i = 0; i < _subjects.length; i++) {
+            mask |= uint256(1) << _internSubject(_subjects[i]);
+        }
+    }
+
+    // Subjects come back in ID order, i.e. the order they were first registered.
+    function _decodeSubjects(uint256 _mask) internal view returns (string[] memory names) {
+        uint256 count = 0;
+        for (uint256 m = _mask; m != 0; m &= m - 1) {
+            count++;
+        }
+        names = new string[](count);
+        uint256 j = 0;
+        for (uint256 id = 0; j < count; id++) {
+            if (((_mask >> id) & 1) == 1) {
+                names[j] = subjectNames[id];
+                j++;
+            }
+        }
     }
 
     function getDepartmentSubjects() public view returns (string[] memory) {
@@ -1,6 +1,7 @@
 // SPDX-License-Identifier: MIT
 pragma solidity ^0.8.0;
 
+import "./PackedCalldata.sol";
 
 
 contract HostelManagement {
@@ -8,28 +9,47 @@ contract HostelManagement {
     string public hostelName;
     string public location;
     string public hostelManager;
-    uint256 public totalRooms;
-    uint256 public occupiedRooms;
-    uint256 public availableRooms;
-    uint256 public roomPricePerMonth;
-    string public roomOccupier;
-    string public studentName;
-    uint256 public studentAge;
-    string public studentGender;
-    string public studentContact;
-    string public studentAddress;
-    string public roomNo;
-    
 
+    // Room counters and price share a single storage slot
+    uint32 public totalRooms;
+    uint32 public occupiedRooms;
+    uint32 public availableRooms;
+    uint32 public registeredStudents;
+    uint128 public roomPricePerMonth;
 
+    // Wallet address, room status and booking flags share a single storage slot
     address payable hostelWalletAddress;
+    RoomStatus public roomStatus;
+    bool public roomBooked;
+    bool public isRoomBooked;
+    bool private initialized;
+    uint32 private firstFreeWord;
+
+    string public roomOccupier;
+    string public roomNo;
+    // Rent paid in but not yet withdrawn by the hostel wallet
     uint256 private hostelWalletBalance;
-    mapping(address => uint256) private studentBalances;
-    mapping(address => bool) private isStudentRegistered;
-    mapping(address => bool) private hasRoomBooked;
-    mapping(address => bool) private isStudentSuspended;
-    mapping(address => bool) private hasPaid;
-    mapping(address => uint256) private studentRoomNo;
+
+    // Bit flags stored in StudentAccount.flags
+    uint8 private constant REGISTERED = 1;
+    uint8 private constant ROOM_BOOKED = 2;
+    uint8 private constant SUSPENDED = 4;
+    uint8 private constant PAID = 8;
+
+    // Per-student bookkeeping packed into one storage slot, so registration
+    // and payment each touch a single slot besides the student's strings
+    struct StudentAccount {
+        uint128 balance;
+        uint32 roomNo;
+        uint8 age;
+        uint8 flags;
+    }
+
+    mapping(address => StudentAccount) private studentAccounts;
+
+    // Room occupancy bitmap: bit (n - 1) % 256 of word (n - 1) / 256 is set while room n is taken.
+    // Every word below firstFreeWord is full, so allocation starts its search there.
+    mapping(uint256 => uint256) private occupancyWords;
 
 
 
@@ -56,8 +76,6 @@ contract HostelManagement {
 
     Database[] public databases;
 
-    bool public isRoomBooked;
-
     constructor(
         string memory _schoolName,
         string memory _hostelName,
@@ -66,21 +84,49 @@ contract HostelManagement {
         uint256 _totalRooms,
         uint256 _roomPricePerMonth
     ) {
+        _initialize(_schoolName, _hostelName, _location, _hostelManager, _totalRooms, _roomPricePerMonth);
+    }
+
+    // Entry point for minimal-proxy clones created by HostelRegistry, which
+    // never run the constructor. Contracts deployed directly are already initialized.
+    function initialize(
+        string memory _schoolName,
+        string memory _hostelName,
+        string memory _location,
+        string memory _hostelManager,
+        uint256 _totalRooms,
+        uint256 _roomPricePerMonth
+    ) public {
+        _initialize(_schoolName, _hostelName, _location, _hostelManager, _totalRooms, _roomPricePerMonth);
+    }
+
+    function _initialize(
+        string memory _schoolName,
+        string memory _hostelName,
+        string memory _location,
+        string memory _hostelManager,
+        uint256 _totalRooms,
+        uint256 _roomPricePerMonth
+    ) internal {
+        require(!initialized, "Hostel already initialized");
+        require(_totalRooms <= type(uint32).max, "Too many rooms");
+        require(_roomPricePerMonth <= type(uint128).max, "Room price too high");
+        initialized = true;
+        hostelWalletAddress = payable(msg.sender);
         schoolName = _schoolName;
         hostelName = _hostelName;
         location = _location;
         hostelManager = _hostelManager;
-        totalRooms = _totalRooms;
-        roomPricePerMonth = _roomPricePerMonth;
-        availableRooms = _totalRooms;
+        totalRooms = uint32(_totalRooms);
+        roomPricePerMonth = uint128(_roomPricePerMonth);
+        availableRooms = uint32(_totalRooms);
         roomBooked = false;
         occupiedRooms = 0;
         isRoomBooked = false;
-
     }
-    bool public roomBooked;
 
     event RoomBooked(
+        address indexed student,
         string studentName,
         uint256 studentAge,
         string studentGender,
@@ -88,7 +134,9 @@ contract HostelManagement {
         string studentAddress,
         uint256 roomPricePerMonth
     );
-    event RoomVacated(string studentName, uint256 refundAmount);
+    event RoomVacated(address indexed student, string studentName, uint256 refundAmount);
+    // Emitted by bookRooms, which takes rooms without registering a student
+    event RoomsBooked(address indexed student, uint256 numberOfRooms);
     event HostelDetailsUpdated(
         string schoolName,
         string hostelName,
@@ -97,56 +145,119 @@ contract HostelManagement {
         uint256 totalRooms,
         uint256 roomPricePerMonth
     );
-    event RoomPaid(string studentName, uint256 amountPaid);
+    event RoomPaid(address indexed student, string studentName, uint256 amountPaid);
+    event PaymentsWithdrawn(address indexed wallet, uint256 amount);
     event StudentDetailsUpdated(
+        address indexed student,
         string studentName,
         uint256 studentAge,
         string studentGender,
         string studentContact,
         string studentAddress
     );
-    event StudentSuspended(string studentName, string reason);
+    event StudentSuspended(address indexed student, string studentName, string reason);
+    event StudentRecordStored(address indexed student, bytes32 recordHash);
 
 
+    // Students registered through registerStudentRecord keep only recordHash: the
+    // keccak256 of their canonical JSON record, held off-chain (scripts/record_store.py).
     struct Student {
         string name;
-        uint256 age;
         string gender;
         string contact;
         string homeAddress;
+        bytes32 recordHash;
     }
 
-    Student public student;
+    mapping(address => Student) private students;
 
     enum RoomStatus {Available, Occupied, Maintenance, Reserved}
-    RoomStatus public roomStatus;
 
 
     function registerStudent(string memory _studentName, uint256 _studentAge, string memory _studentGender, string memory _studentContact, string memory _studentAddress) public {
+        Student storage student = students[msg.sender];
         student.name = _studentName;
-        student.age = _studentAge;
         student.gender = _studentGender;
         student.contact = _studentContact;
         student.homeAddress = _studentAddress;
+        _admitStudent(_studentAge);
+        emit RoomBooked(msg.sender, _studentName, _studentAge, _studentGender, _studentContact, _studentAddress, roomPricePerMonth);
+    }
 
+    // Packed-calldata variants of registerStudent / updateStudentDetails. The payload is
+    // age (1 byte) followed by name, gender, contact and address, each as a 1-byte length
+    // and its UTF-8 bytes (see scripts/packed_calldata.py).
+    function registerStudentPacked(bytes calldata _payload) public {
+        (string memory name, uint256 age, string memory gender, string memory contact, string memory homeAddress) = _decodeStudentPayload(_payload);
+        registerStudent(name, age, gender, contact, homeAddress);
+    }
+
+    function updateStudentDetailsPacked(bytes calldata _payload) public {
+        (string memory name, uint256 age, string memory gender, string memory contact, string memory homeAddress) = _decodeStudentPayload(_payload);
+        updateStudentDetails(name, age, gender, contact, homeAddress);
+    }
+
+    function _decodeStudentPayload(bytes calldata _payload) internal pure returns (string memory name, uint256 age, string memory gender, string memory contact, string memory homeAddress) {
+        require(_payload.length > 0, "Malformed payload");
+        uint256 offset;
+        (age, offset) = PackedCalldata.readUint8(_payload, 0);
+        (name, offset) = PackedCalldata.readString(_payload, offset);
+        (gender, offset) = PackedCalldata.readString(_payload, offset);
+        (contact, offset) = PackedCalldata.readString(_payload, offset);
+        (homeAddress, offset) = PackedCalldata.readString(_payload, offset);
+        require(offset == _payload.length, "Malformed payload");
+    }
 
+    // Registration that stores only the hash of the student's personal details
+    function registerStudentRecord(bytes32 _recordHash, uint256 _studentAge) public {
+        require(_recordHash != bytes32(0), "Record hash required");
+        students[msg.sender].recordHash = _recordHash;
+        _admitStudent(_studentAge);
+        emit RoomBooked(msg.sender, "", _studentAge, "", "", "", roomPricePerMonth);
+        emit StudentRecordStored(msg.sender, _recordHash);
+    }
+
+    function _admitStudent(uint256 _studentAge) internal {
+        StudentAccount memory account = studentAccounts[msg.sender];
+        require((account.flags & REGISTERED) == 0, "Student already registered");
+        require((account.flags & SUSPENDED) == 0, "Student is suspended");
         require(availableRooms > 0, "No rooms available");
-        require(!roomBooked, "Room already booked");
+        require(_studentAge <= type(uint8).max, "Invalid age");
+        account.age = uint8(_studentAge);
+        account.roomNo = _allocateRoom();
+        account.flags |= REGISTERED | ROOM_BOOKED;
+        studentAccounts[msg.sender] = account;
+        registeredStudents += 1;
+
         roomBooked = true;
         occupiedRooms += 1;
         availableRooms -= 1;
         roomStatus = RoomStatus.Occupied;
-        emit RoomBooked(student.name, student.age, student.gender, student.contact, student.homeAddress, roomPricePerMonth);
     }
 
 
     function vacateRoom() public {
-        require(roomStatus == RoomStatus.Occupied, "Room is not occupied");
+        require((studentAccounts[msg.sender].flags & ROOM_BOOKED) != 0, "Room is not occupied");
+        _vacateRoom(msg.sender);
+    }
+
+    function _vacateRoom(address _student) internal {
+        StudentAccount memory account = studentAccounts[_student];
+        if (account.roomNo != 0) {
+            _releaseRoom(account.roomNo);
+            account.roomNo = 0;
+        }
+        // leaving the hostel ends the registration, so the student can register again later
+        account.flags &= ~(ROOM_BOOKED | REGISTERED);
+        studentAccounts[_student] = account;
+        registeredStudents -= 1;
         isRoomBooked = false;
         occupiedRooms -= 1;
         availableRooms += 1;
-        roomStatus = RoomStatus.Available;
-        emit RoomVacated(student.name, roomPricePerMonth);
+        if (occupiedRooms == 0) {
+            roomStatus = RoomStatus.Available;
+        }
+        emit RoomVacated(_student, students[_student].name, roomPricePerMonth);
     }
 
 
@@ -156,13 +267,40 @@ contract HostelManagement {
         return availableRooms;
     }
 
+    // Rent accrues in the contract; the hostel wallet collects it with withdrawPayments.
     function makePayment() public payable {
-        require(roomStatus == RoomStatus.Occupied, "Room is not occupied");
+        StudentAccount memory account = studentAccounts[msg.sender];
+        require((account.flags & ROOM_BOOKED) != 0, "Room is not occupied");
         require(msg.value >= roomPricePerMonth, "Insufficient payment");
-        hostelWalletAddress.transfer(msg.value);
-        studentBalances[msg.sender] += msg.value;
-        hasPaid[msg.sender] = true;
-        emit RoomPaid(student.name, msg.value);
+        hostelWalletBalance += msg.value;
+        account.balance += uint128(msg.value);
+        account.flags |= PAID;
+        studentAccounts[msg.sender] = account;
+        emit RoomPaid(msg.sender, students[msg.sender].name, msg.value);
+    }
+
+    function withdrawPayments() public {
+        require(msg.sender == hostelWalletAddress, "Only the hostel wallet can withdraw");
+        uint256 amount = hostelWalletBalance;
+        require(amount > 0, "Nothing to withdraw");
+        hostelWalletBalance = 0;
+        (bool sent, ) = hostelWalletAddress.call{value: amount}("");
+        require(sent, "Withdrawal failed");
+        emit PaymentsWithdrawn(hostelWalletAddress, amount);
+    }
+
+    function setHostelWallet(address payable _wallet) public {
+        require(msg.sender == hostelWalletAddress, "Only the hostel wallet can change it");
+        require(_wallet != address(0), "Invalid wallet");
+        hostelWalletAddress = _wallet;
+    }
+
+    function getHostelWallet() public view returns (address) {
+        return hostelWalletAddress;
+    }
+
+    function getAccruedPayments() public view returns (uint256) {
+        return hostelWalletBalance;
     }
 
 
@@ -174,14 +312,16 @@ contract HostelManagement {
         uint256 _totalRooms,
         uint256 _roomPricePerMonth
     ) public {
+        require(_totalRooms <= type(uint32).max, "Too many rooms");
+        require(_roomPricePerMonth <= type(uint128).max, "Room price too high");
         schoolName = _schoolName;
         hostelName = _hostelName;
         location = _location;
         hostelManager = _hostelManager;
-        totalRooms = _totalRooms;
-        roomPricePerMonth = _roomPricePerMonth;
+        totalRooms = uint32(_totalRooms);
+        roomPricePerMonth = uint128(_roomPricePerMonth);
         availableRooms = totalRooms - occupiedRooms;
-        emit HostelDetailsUpdated(schoolName, hostelName, location, hostelManager, totalRooms, roomPricePerMonth);
+        emit HostelDetailsUpdated(_schoolName, _hostelName, _location, _hostelManager, _totalRooms, _roomPricePerMonth);
     }
 
 
@@ -193,33 +333,77 @@ contract HostelManagement {
         string memory _studentContact,
         string memory _studentAddress
     ) public {
+        require((studentAccounts[msg.sender].flags & REGISTERED) != 0, "Student not found");
+        require(_studentAge <= type(uint8).max, "Invalid age");
+        Student storage student = students[msg.sender];
         student.name = _studentName;
-        student.age = _studentAge;
         student.gender = _studentGender;
         student.contact = _studentContact;
         student.homeAddress = _studentAddress;
-        emit StudentDetailsUpdated(student.name, student.age, student.gender, student.contact, student.homeAddress);
+        studentAccounts[msg.sender].age = uint8(_studentAge);
+        emit StudentDetailsUpdated(msg.sender, _studentName, _studentAge, _studentGender, _studentContact, _studentAddress);
+    }
+
+
+    function updateStudentRecord(bytes32 _recordHash, uint256 _studentAge) public {
+        require((studentAccounts[msg.sender].flags & REGISTERED) != 0, "Student not found");
+        require(_recordHash != bytes32(0), "Record hash required");
+        require(_studentAge <= type(uint8).max, "Invalid age");
+        students[msg.sender].recordHash = _recordHash;
+        studentAccounts[msg.sender].age = uint8(_studentAge);
+        emit StudentRecordStored(msg.sender, _recordHash);
+    }
+
+    function getStudentRecordHash(address _student) public view returns (bytes32) {
+        return students[_student].recordHash;
     }
 
 
     function getStudentDetails() public view returns(string memory, uint256, string memory, string memory, string memory) {
-        return (student.name, student.age, student.gender, student.contact, student.homeAddress);
+        return getStudentDetailsByAddress(msg.sender);
     }
 
+    function getStudentDetailsByAddress(address _student) public view returns(string memory, uint256, string memory, string memory, string memory) {
+        Student storage student = students[_student];
+        return (student.name, studentAccounts[_student].age, student.gender, student.contact, student.homeAddress);
+    }
 
-    function suspendStudent(string memory _studentName, string memory /* reason */) public {
-        require(keccak256(abi.encodePacked(student.name)) == keccak256(abi.encodePacked(_studentName)), "Student not found");
-        vacateRoom();
-        student.name = "";
-        student.age = 0;
-        student.gender = "";
-        student.contact = "";
-        student.homeAddress = "";
-        emit StudentSuspended(_studentName, /* reason */ "");
+    function getStudentAccount(address _student) public view returns (uint256 balance, uint256 studentRoomNo, bool registered, bool hasRoom, bool suspended, bool paid) {
+        StudentAccount memory account = studentAccounts[_student];
+        return (
+            account.balance,
+            account.roomNo,
+            (account.flags & REGISTERED) != 0,
+            (account.flags & ROOM_BOOKED) != 0,
+            (account.flags & SUSPENDED) != 0,
+            (account.flags & PAID) != 0
+        );
     }
-    event databaseUpdated(string studentName, uint256 studentAge, string studentGender, string studentContact, string studentAddress, uint256 roomPricePerMonth);
+
+
+    function suspendStudent(address _student, string memory _reason) public {
+        require(msg.sender == hostelWalletAddress, "Only the hostel wallet can suspend a student");
+        require((studentAccounts[_student].flags & REGISTERED) != 0, "Student not found");
+        if ((studentAccounts[_student].flags & ROOM_BOOKED) != 0) {
+            // also drops the registration
+            _vacateRoom(_student);
+        } else {
+            registeredStudents -= 1;
+        }
+        string memory name = students[_student].name;
+        delete students[_student];
+        studentAccounts[_student] = StudentAccount({
+            balance: studentAccounts[_student].balance,
+            roomNo: 0,
+            age: 0,
+            flags: SUSPENDED
+        });
+        emit StudentSuspended(_student, name, _reason);
+    }
+    event databaseUpdated(address indexed student, string studentName, uint256 studentAge, string studentGender, string studentContact, string studentAddress, uint256 roomPricePerMonth);
     function storeInDataBase() public {
-        emit databaseUpdated(student.name, student.age, student.gender, student.contact, student.homeAddress, roomPricePerMonth);
+        Student storage student = students[msg.sender];
+        emit databaseUpdated(msg.sender, student.name, studentAccounts[msg.sender].age, student.gender, student.contact, student.homeAddress, roomPricePerMonth);
     }
 
     function bookRooms(uint256 numberOfRooms) public {
@@ -227,15 +411,76 @@ contract HostelManagement {
         require(availableRooms >= numberOfRooms, "Not enough rooms available");
         require(!isRoomBooked, "Room already booked");
         isRoomBooked = true;
-        occupiedRooms += numberOfRooms;
-        availableRooms -= numberOfRooms;
+        for (uint256 i = 0; i < numberOfRooms; i++) {
+            _allocateRoom();
+        }
+        occupiedRooms += uint32(numberOfRooms);
+        availableRooms -= uint32(numberOfRooms);
         roomStatus = RoomStatus.Occupied;
-        emit RoomBooked(student.name, student.age, student.gender, student.contact, student.homeAddress, roomPricePerMonth);
+        emit RoomsBooked(msg.sender, numberOfRooms);
+    }
+
+    function isResident(address _student) public view returns (bool) {
+        return (studentAccounts[_student].flags & REGISTERED) != 0;
+    }
+
+    function getHostelSnapshot() public view returns (string memory, string memory, string memory, string memory, uint256, uint256, uint256, uint256, string memory, uint256) {
+        return (schoolName, hostelName, location, hostelManager, totalRooms, occupiedRooms, availableRooms, roomPricePerMonth, getRoomStatus(), registeredStudents);
+    }
+
+    function getOccupancyBitmap(uint256 startWord, uint256 count) public view returns (uint256[] memory words) {
+        words = new uint256[](count);
+        for (uint256 i = 0; i < count; i++) {
+            words[i] = occupancyWords[startWord + i];
+        }
+    }
+
+    function isRoomOccupied(uint256 _roomNo) public view returns (bool) {
+        require(_roomNo > 0 && _roomNo <= totalRooms, "Invalid room number");
+        uint256 index = _roomNo - 1;
+        return ((occupancyWords[index / 256] >> (index % 256)) & 1) == 1;
     }
+
+    // Claims the lowest-numbered free room and returns its 1-based number.
+    function _allocateRoom() internal returns (uint32) {
+        uint256 wordCount = (uint256(totalRooms) + 255) / 256;
+        for (uint256 w = firstFreeWord; w < wordCount; w++) {
+            uint256 word = occupancyWords[w];
+            if (word != type(uint256).max) {
+                uint256 bit = _trailingZeros(~word);
+                uint256 index = w * 256 + bit;
+                require(index < totalRooms, "No rooms available");
+                occupancyWords[w] = word | (uint256(1) << bit);
+                firstFreeWord = uint32(w);
+                return uint32(index + 1);
+            }
+        }
+        revert("No rooms available");
+    }
+
+    function _releaseRoom(uint32 _roomNo) internal {
+        uint256 index = uint256(_roomNo) - 1;
+        uint256 w = index / 256;
+        occupancyWords[w] &= ~(uint256(1) << (index % 256));
+        if (w < firstFreeWord) {
+            firstFreeWord = uint32(w);
+        }
+    }
+
+    // Index of the lowest set bit of a non-zero word, by binary search over halves.
+    function _trailingZeros(uint256 x) internal pure returns (uint256 n) {
+        if ((x & type(uint128).max) == 0) { n += 128; x >>= 128; }
+        if ((x & type(uint64).max) == 0) { n += 64; x >>= 64; }
+        if ((x & type(uint32).max) == 0) { n += 32; x >>= 32; }
+        if ((x & type(uint16).max) == 0) { n += 16; x >>= 16; }
+        if ((x & type(uint8).max) == 0) { n += 8; x >>= 8; }
+        if ((x & 0xf) == 0) { n += 4; x >>= 4; }
+        if ((x & 0x3) == 0) { n += 2; x >>= 2; }
+        if ((x & 0x1) == 0) { n += 1; }
+    }
+
     function getRoomStatus() public view returns (string memory) {
         string[4] memory statusStrings = ["Available", "Occupied", "Maintenance", "Reserved"];
         return statusStrings[uint256(roomStatus)];
     }
 }
-
-
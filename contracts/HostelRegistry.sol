@@ -0,0 +1,82 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+
+import "./HostelManagement.sol";
+
+contract HostelRegistry {
+    address public owner;
+    address public implementation;
+    address[] public hostels;
+
+    struct HostelConfig {
+        string schoolName;
+        string hostelName;
+        string location;
+        string hostelManager;
+        uint256 totalRooms;
+        uint256 roomPricePerMonth;
+    }
+
+    event HostelCreated(address indexed hostel, string hostelName);
+
+    constructor(address _implementation) {
+        owner = msg.sender;
+        implementation = _implementation;
+    }
+
+    function createHostel(
+        string memory _schoolName,
+        string memory _hostelName,
+        string memory _location,
+        string memory _hostelManager,
+        uint256 _totalRooms,
+        uint256 _roomPricePerMonth
+    ) public returns (address) {
+        require(msg.sender == owner, "Only the registry owner can create hostels.");
+        return _createHostel(HostelConfig(_schoolName, _hostelName, _location, _hostelManager, _totalRooms, _roomPricePerMonth));
+    }
+
+    function createHostels(HostelConfig[] memory _configs) public returns (address[] memory created) {
+        require(msg.sender == owner, "Only the registry owner can create hostels.");
+        created = new address[](_configs.length);
+        for (uint256 i = 0; i < _configs.length; i++) {
+            created[i] = _createHostel(_configs[i]);
+        }
+    }
+
+    function getHostelCount() public view returns (uint256) {
+        return hostels.length;
+    }
+
+    function getHostels() public view returns (address[] memory) {
+        return hostels;
+    }
+
+    function _createHostel(HostelConfig memory _config) internal returns (address hostel) {
+        hostel = _clone(implementation);
+        HostelManagement(hostel).initialize(
+            _config.schoolName,
+            _config.hostelName,
+            _config.location,
+            _config.hostelManager,
+            _config.totalRooms,
+            _config.roomPricePerMonth
+        );
+        // initialize makes the caller (this registry) the hostel wallet; hand it to the owner
+        HostelManagement(hostel).setHostelWallet(payable(owner));
+        hostels.push(hostel);
+        emit HostelCreated(hostel, _config.hostelName);
+    }
+
+    // EIP-1167 minimal proxy: a 55-byte contract that delegatecalls everything to `_implementation`
+    function _clone(address _implementation) internal returns (address instance) {
+        assembly {
+            let ptr := mload(0x40)
+            mstore(ptr, 0x3d602d80600a3d3981f3363d3d373d3d3d363d73000000000000000000000000)
+            mstore(add(ptr, 0x14), shl(0x60, _implementation))
+            mstore(add(ptr, 0x28), 0x5af43d82803e903d91602b57fd5bf30000000000000000000000000000000000)
+            instance := create(0, ptr, 0x37)
+        }
+        require(instance != address(0), "Hostel clone failed");
+    }
+}
@@ -0,0 +1,20 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+
+// Readers for the packed registration payloads built by scripts/packed_calldata.py:
+// single-byte integers, and strings as a 1-byte length followed by their UTF-8 bytes.
+library PackedCalldata {
+    function readUint8(bytes calldata _payload, uint256 _offset) internal pure returns (uint256 value, uint256 next) {
+        require(_offset < _payload.length, "Malformed payload");
+        value = uint8(_payload[_offset]);
+        next = _offset + 1;
+    }
+
+    function readString(bytes calldata _payload, uint256 _offset) internal pure returns (string memory value, uint256 next) {
+        uint256 length;
+        (length, _offset) = readUint8(_payload, _offset);
+        next = _offset + length;
+        require(next <= _payload.length, "Malformed payload");
+        value = string(_payload[_offset:next]);
+    }
+}
@@ -17,4 +17,23 @@ contract SimpleStorage {
     function retrieveAll() public view returns (uint256[] memory) {
         return FavoriteNumbers;
     }
+
+    function count() public view returns (uint256) {
+        return FavoriteNumbers.length;
+    }
+
+    function retrieveRange(uint256 offset, uint256 limit) public view returns (uint256[] memory) {
+        uint256 total = FavoriteNumbers.length;
+        if (offset >= total) {
+            return new uint256[](0);
+        }
+        if (limit > total - offset) {
+            limit = total - offset;
+        }
+        uint256[] memory page = new uint256[](limit);
+        for (uint256 i = 0; i < limit; i++) {
+            page[i] = FavoriteNumbers[offset + i];
+        }
+        return page;
+    }
 }
\ No newline at end of file
@@ -0,0 +1,84 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+
+// Registration and payment paths of HostelManagement with the original
+// one-mapping-per-field, full-width storage layout. Only used by the test
+// suite to compare gas against the packed layout.
+contract HostelManagementUnpacked {
+    uint256 public totalRooms;
+    uint256 public occupiedRooms;
+    uint256 public availableRooms;
+    uint256 public roomPricePerMonth;
+    uint256 public registeredStudents;
+
+    address payable hostelWalletAddress;
+    mapping(address => uint256) private studentBalances;
+    mapping(address => bool) private isStudentRegistered;
+    mapping(address => bool) private hasRoomBooked;
+    mapping(address => bool) private isStudentSuspended;
+    mapping(address => bool) private hasPaid;
+    mapping(address => uint256) private studentRoomNo;
+
+    struct Student {
+        string name;
+        uint256 age;
+        string gender;
+        string contact;
+        string homeAddress;
+    }
+
+    mapping(address => Student) private students;
+
+    bool public roomBooked;
+
+    enum RoomStatus {Available, Occupied, Maintenance, Reserved}
+    RoomStatus public roomStatus;
+
+    event RoomBooked(
+        address indexed student,
+        string studentName,
+        uint256 studentAge,
+        string studentGender,
+        string studentContact,
+        string studentAddress,
+        uint256 roomPricePerMonth
+    );
+    event RoomPaid(address indexed student, string studentName, uint256 amountPaid);
+
+    constructor(uint256 _totalRooms, uint256 _roomPricePerMonth) {
+        totalRooms = _totalRooms;
+        roomPricePerMonth = _roomPricePerMonth;
+        availableRooms = _totalRooms;
+    }
+
+    function registerStudent(string memory _studentName, uint256 _studentAge, string memory _studentGender, string memory _studentContact, string memory _studentAddress) public {
+        require(!isStudentRegistered[msg.sender], "Student already registered");
+        require(!isStudentSuspended[msg.sender], "Student is suspended");
+        require(availableRooms > 0, "No rooms available");
+
+        Student storage student = students[msg.sender];
+        student.name = _studentName;
+        student.age = _studentAge;
+        student.gender = _studentGender;
+        student.contact = _studentContact;
+        student.homeAddress = _studentAddress;
+        isStudentRegistered[msg.sender] = true;
+        hasRoomBooked[msg.sender] = true;
+        registeredStudents += 1;
+
+        roomBooked = true;
+        occupiedRooms += 1;
+        availableRooms -= 1;
+        roomStatus = RoomStatus.Occupied;
+        emit RoomBooked(msg.sender, student.name, student.age, student.gender, student.contact, student.homeAddress, roomPricePerMonth);
+    }
+
+    function makePayment() public payable {
+        require(hasRoomBooked[msg.sender], "Room is not occupied");
+        require(msg.value >= roomPricePerMonth, "Insufficient payment");
+        hostelWalletAddress.transfer(msg.value);
+        studentBalances[msg.sender] += msg.value;
+        hasPaid[msg.sender] = true;
+        emit RoomPaid(msg.sender, students[msg.sender].name, msg.value);
+    }
+}
@@ -0,0 +1,231 @@
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from brownie import accounts, chain, web3
+from hexbytes import HexBytes
+
+from scripts.contract_loader import contracts as project_contracts
+
+
+BENCHMARK_DIR = Path("benchmarks")
+RESULTS_PATH = BENCHMARK_DIR / "results.json"
+BASELINE_PATH = BENCHMARK_DIR / "baseline.json"
+DEFAULT_SIZES = (10, 100, 1000)
+DEFAULT_THRESHOLD = 0.05
+ROOM_PRICE = 50000
+# Fraction of the block gas limit a populate batch may use
+BATCH_GAS_HEADROOM = 0.8
+
+
+def _student_rows(start, count):
+    """Columns for addStudentsBatch covering students ``start`` .. ``start + count - 1``."""
+    ids = range(start, start + count)
+    return (
+        [f"Student{i}" for i in ids],
+        [f"student{i}@example.com" for i in ids],
+        [18 + i % 10 for i in ids],
+        [f"USN{i:06d}" for i in ids],
+        ["CS"] * count,
+        [["Math", "Physics"]] * count,
+        ["Prof. Smith"] * count,
+    )
+
+
+def rows_per_batch(contract, account):
+    """How many addStudentsBatch rows fit in one transaction under the block gas limit.
+
+    The per-row cost is the difference between estimates for two rows and one
+    row; the rest of the one-row estimate is the fixed transaction overhead.
+    """
+    one = contract.addStudentsBatch.estimate_gas(*_student_rows(0, 1), {"from": account})
+    two = contract.addStudentsBatch.estimate_gas(*_student_rows(0, 2), {"from": account})
+    per_row = max(1, two - one)
+    budget = web3.eth.get_block("latest").gasLimit * BATCH_GAS_HEADROOM
+    return max(1, int((budget - (one - per_row)) // per_row))
+
+
+def setup_simple_storage(size, account):
+    contract = project_contracts.SimpleStorage.deploy({"from": account})
+    for i in range(size):
+        contract.store(i, {"from": account})
+    return contract, {}
+
+
+def setup_classroom(size, account):
+    contract = project_contracts.Classroom.deploy({"from": account})
+    batch = rows_per_batch(contract, account)
+    for start in range(0, size, batch):
+        contract.addStudentsBatch(*_student_rows(start, min(batch, size - start)), {"from": account})
+    contract.registerStudent(
+        "Main", "main@example.com", 20, "USN-MAIN", "CS", ["Math"], "Prof. Smith", {"from": account}
+    )
+    contract.registerTeacher("Prof. Smith", "smith@example.com", 40, "CS", ["Math"], {"from": account})
+    return contract, {"last": size - 1}
+
+
+def setup_hostel(size, account):
+    contract = project_contracts.HostelManagement.deploy(
+        "University of Lagos", "Moremi Hall", "UNILAG Campus", "Mr. Johnson", size + 10, ROOM_PRICE,
+        {"from": account}
+    )
+    residents = []
+    for i in range(size):
+        resident = accounts.add()
+        account.transfer(resident, "1 ether")
+        contract.registerStudent(f"Resident{i}", 20, "Female", "0800000000", "Campus", {"from": resident})
+        residents.append(resident)
+    newcomer = accounts.add()
+    account.transfer(newcomer, "1 ether")
+    return contract, {"resident": residents[-1], "newcomer": newcomer}
+
+
+# Each entry maps a function name to a builder returning (method, args, tx_params).
+# tx_params of None marks a read-only call.
+BENCHMARKS = {
+    "SimpleStorage": (setup_simple_storage, {
+        "store": lambda c, a, ctx: (c.store, (7,), {"from": a}),
+        "retrieve": lambda c, a, ctx: (c.retrieve, (), None),
+        "retrieveAll": lambda c, a, ctx: (c.retrieveAll, (), None),
+        "retrieveRange": lambda c, a, ctx: (c.retrieveRange, (0, 100), None),
+        "count": lambda c, a, ctx: (c.count, (), None),
+    }),
+    "Classroom": (setup_classroom, {
+        "addStudentToList": lambda c, a, ctx: (c.addStudentToList, tuple(col[0] for col in _student_rows(10**6, 1)), {"from": a}),
+        "addStudentsBatch": lambda c, a, ctx: (c.addStudentsBatch, _student_rows(10**6, 10), {"from": a}),
+        "checkStudentSuspensionByName": lambda c, a, ctx: (c.checkStudentSuspensionByName, (f"Student{ctx['last']}",), None),
+        "checkStudentSuspensionByUSN": lambda c, a, ctx: (c.checkStudentSuspensionByUSN, (f"USN{ctx['last']:06d}",), None),
+        "getStudentCount": lambda c, a, ctx: (c.getStudentCount, (), None),
+        "getStudentDetails": lambda c, a, ctx: (c.getStudentDetails, (), None),
+        "updateStudentDetails": lambda c, a, ctx: (c.updateStudentDetails, ("Main Updated", 21, "new@example.com"), {"from": a}),
+        "suspendStudent": lambda c, a, ctx: (c.suspendStudent, ("Main", "Benchmark", 86400), {"from": a}),
+        "updateTeacherDetails": lambda c, a, ctx: (c.updateTeacherDetails, ("Prof. Smith", 41, "new@example.com"), {"from": a}),
+        "clearStudentList": lambda c, a, ctx: (c.clearStudentList, (), {"from": a}),
+    }),
+    "HostelManagement": (setup_hostel, {
+        "registerStudent": lambda c, a, ctx: (c.registerStudent, ("Newcomer", 19, "Male", "0811111111", "Campus"), {"from": ctx["newcomer"]}),
+        "makePayment": lambda c, a, ctx: (c.makePayment, (), {"from": ctx["resident"], "value": ROOM_PRICE}),
+        "updateStudentDetails": lambda c, a, ctx: (c.updateStudentDetails, ("Updated", 21, "Female", "0822222222", "Town"), {"from": ctx["resident"]}),
+        "vacateRoom": lambda c, a, ctx: (c.vacateRoom, (), {"from": ctx["resident"]}),
+        "suspendStudent": lambda c, a, ctx: (c.suspendStudent, (ctx["resident"], "Benchmark"), {"from": a}),
+        "storeInDataBase": lambda c, a, ctx: (c.storeInDataBase, (), {"from": ctx["resident"]}),
+        "updateHostelDetails": lambda c, a, ctx: (c.updateHostelDetails, ("UI", "Queen Elizabeth Hall", "UI Campus", "Mrs. Williams", 5000, ROOM_PRICE), {"from": a}),
+        "bookRooms": lambda c, a, ctx: (c.bookRooms, (1,), {"from": a}),
+        "getStudentDetailsByAddress": lambda c, a, ctx: (c.getStudentDetailsByAddress, (ctx["resident"],), None),
+        "getHostelSnapshot": lambda c, a, ctx: (c.getHostelSnapshot, (), None),
+        "getRoomStatus": lambda c, a, ctx: (c.getRoomStatus, (), None),
+    }),
+}
+
+
+def measure(method, args, tx_params):
+    """Run one call and return its gas, calldata size and wall time."""
+    calldata = len(HexBytes(method.encode_input(*args)))
+    start = time.perf_counter()
+    if tx_params is None:
+        method.call(*args)
+        wall_time = time.perf_counter() - start
+        gas = method.estimate_gas(*args)
+    else:
+        tx = method(*args, tx_params)
+        tx.wait(1)
+        wall_time = time.perf_counter() - start
+        gas = tx.gas_used
+    return {"gas": gas, "calldata_bytes": calldata, "wall_time": wall_time}
+
+
+def run(sizes=DEFAULT_SIZES, contracts=None):
+    """Benchmark every registered function at each data size.
+
+    Each function runs against the same populated state: the chain is
+    snapshotted after setup and reverted after every measurement.
+    Results are keyed "Contract.function@size".
+    """
+    account = accounts[0]
+    results = {}
+    for contract_name, (setup, functions) in BENCHMARKS.items():
+        if contracts and contract_name not in contracts:
+            continue
+        for size in sizes:
+            try:
+                contract, context = setup(size, account)
+            except Exception as e:
+                # record the failure against every function so compare() flags them all
+                for function_name in functions:
+                    key = f"{contract_name}.{function_name}@{size}"
+                    results[key] = {"error": f"setup failed: {e}"}
+                    print(f"{key}: {results[key]}")
+                continue
+            chain.snapshot()
+            for function_name, build in functions.items():
+                method, args, tx_params = build(contract, account, context)
+                key = f"{contract_name}.{function_name}@{size}"
+                try:
+                    results[key] = measure(method, args, tx_params)
+                except Exception as e:
+                    results[key] = {"error": str(e)}
+                chain.revert()
+                print(f"{key}: {results[key]}")
+    return results
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Return (key, message) for every regression against the baseline.
+
+    A regression is gas more than ``threshold`` (a fraction) above the
+    baseline, a measurement that errored, or a baseline entry missing from
+    ``results``.
+    """
+    regressions = []
+    for key, current in sorted(results.items()):
+        if "error" in current:
+            regressions.append((key, f"failed: {current['error']}"))
+            continue
+        previous = baseline.get(key)
+        if not previous or "gas" not in previous:
+            continue
+        if current["gas"] > previous["gas"] * (1 + threshold):
+            increase = (current["gas"] - previous["gas"]) / previous["gas"]
+            regressions.append((key, f"gas {previous['gas']} -> {current['gas']} (+{increase:.1%})"))
+    for key in sorted(set(baseline) - set(results)):
+        regressions.append((key, "missing from this run"))
+    return regressions
+
+
+def main():
+    """Run the suite, write results as JSON and fail on gas regressions.
+
+    Configured through environment variables:
+    BENCHMARK_SIZES (comma separated, default 10,100,1000),
+    BENCHMARK_CONTRACTS (comma separated, default all),
+    BENCHMARK_THRESHOLD (fractional gas increase allowed, default 0.05) and
+    BENCHMARK_UPDATE_BASELINE=1 to store this run as the new baseline.
+    """
+    sizes = tuple(int(size) for size in os.environ.get("BENCHMARK_SIZES", ",".join(map(str, DEFAULT_SIZES))).split(","))
+    contracts = [name for name in os.environ.get("BENCHMARK_CONTRACTS", "").split(",") if name]
+    threshold = float(os.environ.get("BENCHMARK_THRESHOLD", DEFAULT_THRESHOLD))
+
+    results = run(sizes, contracts)
+    BENCHMARK_DIR.mkdir(exist_ok=True)
+    RESULTS_PATH.write_text(json.dumps(results, indent=2, sort_keys=True))
+    print(f"\nResults written to {RESULTS_PATH}")
+
+    if os.environ.get("BENCHMARK_UPDATE_BASELINE") == "1" or not BASELINE_PATH.exists():
+        BASELINE_PATH.write_text(json.dumps(results, indent=2, sort_keys=True))
+        print(f"Baseline stored at {BASELINE_PATH}")
+        return
+
+    baseline = json.loads(BASELINE_PATH.read_text())
+    # only entries this run was asked to measure can go missing
+    baseline = {
+        key: entry for key, entry in baseline.items()
+        if int(key.rsplit("@", 1)[1]) in sizes and (not contracts or key.split(".", 1)[0] in contracts)
+    }
+    regressions = compare(results, baseline, threshold)
+    for key, message in regressions:
+        print(f"✗ {key}: {message}")
+    if regressions:
+        sys.exit(1)
+    print(f"✓ No gas regressions above {threshold:.0%}")
@@ -0,0 +1,32 @@
+from brownie import web3
+from hexbytes import HexBytes
+
+
+def chain_key():
+    """Identify the connected chain by its chain id and genesis block hash.
+
+    Local chains reuse chain ids and, after a reset, redeploy contracts to the
+    same deterministic addresses; the genesis hash changes on every reset, so
+    cached state keyed by this value is never applied to a different chain.
+    """
+    genesis = web3.eth.get_block(0)
+    return f"{web3.eth.chain_id}:{to_hex(genesis.hash)}"
+
+
+def to_hex(value):
+    """Lower-case 0x-prefixed hex for bytes, HexBytes or a hex string."""
+    return "0x" + bytes(HexBytes(value)).hex()
+
+
+def event_decoders(contract, names):
+    """Map each event's topic hash to a web3 decoder for it.
+
+    The keys double as the topic filter for eth_getLogs.
+    """
+    events = web3.eth.contract(address=contract.address, abi=contract.abi).events
+    return {contract.topics[name]: getattr(events, name)() for name in names}
+
+
+def decode_logs(decoders, raw_logs):
+    """Decode raw eth_getLogs entries with the decoder for their first topic."""
+    return [decoders[to_hex(raw["topics"][0])].process_log(raw) for raw in raw_logs]
@@ -1,4 +1,12 @@
-from brownie import Classroom, accounts, network, web3
+import time
+from collections import deque
+
+from brownie import accounts, network, web3
+
+from scripts.contract_loader import contracts
+from scripts.instrumentation import instrument, print_summary, wait_for
+from scripts.packed_calldata import encode_classroom_student
+from scripts.rpc_transport import install_transport
 
 
 def get_account():
@@ -16,13 +24,15 @@ def get_account():
     raise ValueError(f"No default account configured for network '{active}'")
 
 
+@instrument
 def deploy():
     deployer = get_account()
-    contract = Classroom.deploy({"from": deployer})
+    contract = contracts.Classroom.deploy({"from": deployer})
     print(f"Contract deployed at: {contract.address}")
     return contract
 
 
+@instrument
 def register_students(contract, students_data):
     """Register multiple students to the contract."""
     deployer = get_account()
@@ -37,6 +47,111 @@ def register_students(contract, students_data):
     print(f"Total students registered: {contract.getStudentCount()}")
 
 
+@instrument
+def register_students_packed(contract, students_data):
+    """Add students to the list through addStudentToListPacked, one packed payload each."""
+    deployer = get_account()
+    for student in students_data:
+        contract.addStudentToListPacked(encode_classroom_student(*student), {"from": deployer})
+        print(f"Added student: {student[0]} ({student[3]})")
+    print(f"Total students registered: {contract.getStudentCount()}")
+
+
+@instrument
+def register_student_records(contract, store, students_data):
+    """Add students to the list keeping email, department and teacher name off-chain.
+
+    ``students_data`` uses the same tuples as register_students. Returns the record hashes.
+    """
+    deployer = get_account()
+    hashes = []
+    for name, emailId, age, usn, department, subjects, teacherName in students_data:
+        record_hash = store.put({"emailId": emailId, "department": department, "teacherName": teacherName})
+        contract.addStudentRecordToList(name, age, usn, subjects, record_hash, {"from": deployer})
+        hashes.append(record_hash)
+        print(f"Added student: {name} ({usn}) with record {record_hash}")
+    print(f"Total students registered: {contract.getStudentCount()}")
+    return hashes
+
+
+def _batch_columns(batch):
+    return [list(column) for column in zip(*batch)]
+
+
+def estimate_batch_size(contract, students_data, account, headroom=0.8):
+    """Largest addStudentsBatch size whose estimated gas fits in ``headroom`` of the block gas limit.
+
+    The per-student cost is taken from estimates for one and two of the given
+    students, so it reflects the actual string lengths being registered.
+    """
+    if len(students_data) < 2:
+        return 1
+    one = contract.addStudentsBatch.estimate_gas(*_batch_columns(students_data[:1]), {"from": account})
+    two = contract.addStudentsBatch.estimate_gas(*_batch_columns(students_data[:2]), {"from": account})
+    per_student = max(1, two - one)
+    budget = web3.eth.get_block("latest").gasLimit * headroom
+    return max(1, int((budget - (one - per_student)) // per_student))
+
+
+@instrument
+def register_students_bulk(contract, students_data, batch_size=None, max_in_flight=8):
+    """Register many students with addStudentsBatch, keeping several transactions in flight.
+
+    Each transaction carries up to ``batch_size`` students, by default as many
+    as fit under the block gas limit (see estimate_batch_size). Nonces are
+    assigned locally so up to ``max_in_flight`` transactions can be pending at
+    once. Returns a dict with the throughput and per-transaction gas figures.
+    """
+    deployer = get_account()
+    if batch_size is None:
+        batch_size = estimate_batch_size(contract, students_data, deployer)
+        print(f"Batch size: {batch_size} students per transaction")
+    nonce = deployer.nonce
+    pending = deque()
+    gas_used = []
+    start = time.time()
+
+    for offset in range(0, len(students_data), batch_size):
+        batch = students_data[offset:offset + batch_size]
+        names, emails, ages, usns, departments, subjects, teachers = _batch_columns(batch)
+        tx = contract.addStudentsBatch(
+            names, emails, ages, usns, departments, subjects, teachers,
+            {"from": deployer, "nonce": nonce, "required_confs": 0}
+        )
+        nonce += 1
+        pending.append((tx, len(batch)))
+        if len(pending) >= max_in_flight:
+            gas_used.append(_wait_for_batch(*pending.popleft()))
+
+    while pending:
+        gas_used.append(_wait_for_batch(*pending.popleft()))
+
+    elapsed = time.time() - start
+    registered = len(students_data)
+    stats = {
+        "students": registered,
+        "transactions": len(gas_used),
+        "seconds": elapsed,
+        "students_per_second": registered / elapsed if elapsed > 0 else 0,
+        "gas_per_transaction": gas_used,
+        "gas_per_student": sum(gas_used) / registered if registered else 0,
+    }
+    print(f"Bulk registered {registered} students in {len(gas_used)} transactions ({elapsed:.2f}s)")
+    print(f"Throughput: {stats['students_per_second']:.1f} students/s")
+    print(f"Gas per transaction: {gas_used}")
+    print(f"Total students registered: {contract.getStudentCount()}")
+    return stats
+
+
+def _wait_for_batch(tx, size):
+    """Wait for a pending batch transaction and return its gas used."""
+    wait_for(tx, 1)
+    if tx.status != 1:
+        raise ValueError(f"Batch transaction {tx.txid} for {size} students failed")
+    return tx.gas_used
+
+
+@instrument
 def register_single_student(contract, name, emailId, age, usn, department, subjects, teacherName):
     """Register a single student using registerStudent (for the main student slot)."""
     deployer = get_account()
@@ -47,6 +162,7 @@ def register_single_student(contract, name, emailId, age, usn, department, subje
     print(f"Registered main student: {name} ({usn})")
 
 
+@instrument
 def update_student_details(contract, new_name, new_age, new_email):
     """Update the main student's details (name, age, emailId)."""
     deployer = get_account()
@@ -56,6 +172,7 @@ def update_student_details(contract, new_name, new_age, new_email):
 
 
 
+@instrument
 def suspend_student(contract, name, reason, duration):
     """Suspend a student by their name."""
     deployer = get_account()
@@ -64,6 +181,7 @@ def suspend_student(contract, name, reason, duration):
     return f"Suspended student{name} for {duration} because of {reason}"
 
 
+@instrument
 def register_teacher(contract, name, emailId, age, department, subjects):
     """Register a teacher to the contract."""
     deployer = get_account()
@@ -72,6 +190,7 @@ def register_teacher(contract, name, emailId, age, department, subjects):
     return f"Registered teacher {name} with email {emailId}"
 
 
+@instrument
 def update_teacher_details(contract, name, new_age, new_email):
     """Update a teacher's details (age, emailId) by their name."""
     deployer = get_account()
@@ -79,8 +198,15 @@ def update_teacher_details(contract, name, new_age, new_email):
     print(f"Updated teacher details: {name}, Age: {new_age}, Email: {new_email}")
     return f"Updated teacher {name} details to Age: {new_age}, Email: {new_email}"
 
+@instrument
 def check_studentSuspension_by_name_or_usn(contract, identifier):
-    """Check student suspension status by name or USN."""
+    """Check student suspension status by name or USN.
+
+    Identifiers starting with "USN" go to checkStudentSuspensionByUSN, anything
+    else to checkStudentSuspensionByName. Both resolve listed students through
+    the contract's hashed name/USN indexes, so the call cost does not grow with
+    the roster.
+    """
     try:
         if identifier.startswith("USN"):
             # Check by USN
@@ -110,6 +236,76 @@ def check_studentSuspension_by_name_or_usn(contract, identifier):
 
 
 
+@instrument
+def add_students_to_department(contract, student_ids):
+    """Add students, by their index in the student list, to the registered department."""
+    deployer = get_account()
+    for student_id in student_ids:
+        contract.addStudentToDepartment(student_id, {"from": deployer})
+    print(f"Added {len(student_ids)} students to the department")
+
+
+def iter_department_members(contract, page_size=500):
+    """Yield the department's student IDs, fetching ``page_size`` IDs per call."""
+    offset = 0
+    while True:
+        page = contract.getDepartmentMembers(offset, page_size)
+        yield from page
+        if len(page) < page_size:
+            return
+        offset += page_size
+
+
+class SubjectTable:
+    """Local cache of the contract's subject ID table.
+
+    Subjects are stored on-chain as a bitmask of IDs. The table is
+    append-only, so names are fetched once and the cache is only extended
+    when a mask refers to an ID it has not seen yet.
+    """
+
+    def __init__(self, contract, page_size=256):
+        self.contract = contract
+        self.page_size = page_size
+        self.names = []
+
+    def refresh(self):
+        """Fetch any subject names registered since the last refresh."""
+        while True:
+            page = self.contract.getSubjectNames(len(self.names), self.page_size)
+            self.names.extend(page)
+            if len(page) < self.page_size:
+                return self.names
+
+    def decode(self, mask):
+        """Return the subject names set in ``mask``, in ID order."""
+        mask = int(mask)
+        if mask.bit_length() > len(self.names):
+            self.refresh()
+        return [name for subject_id, name in enumerate(self.names) if (mask >> subject_id) & 1]
+
+    def encode(self, subjects):
+        """Return the mask for ``subjects``; every name must already be registered."""
+        if any(subject not in self.names for subject in subjects):
+            self.refresh()
+        mask = 0
+        for subject in subjects:
+            if subject not in self.names:
+                raise ValueError(f"Unknown subject: {subject}")
+            mask |= 1 << self.names.index(subject)
+        return mask
+
+
+@instrument
+def get_student_subjects(contract, table=None):
+    """Decode the registered student's subjects from their on-chain mask."""
+    table = table or SubjectTable(contract)
+    subjects = table.decode(contract.getStudentSubjectMask())
+    print(f"Student Subjects: {subjects}")
+    return subjects
+
+
+@instrument
 def  get_teacher_details(contract):
     deployer = get_account()
     try:
@@ -121,6 +317,7 @@ def  get_teacher_details(contract):
         return None
 
 def main():
+    install_transport()
     contract = deploy()
     
     # Register a main student first
@@ -158,4 +355,6 @@ def main():
 
     get_teacher_details(contract)
     # Update the teacher's details
-    update_teacher_details(contract, "Prof. Mahesh", 46, "maheshtr@jainuniversity.ac.in")
\ No newline at end of file
+    update_teacher_details(contract, "Prof. Mahesh", 46, "maheshtr@jainuniversity.ac.in")
+
+    print_summary()
\ No newline at end of file
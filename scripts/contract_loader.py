@@ -0,0 +1,89 @@
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from brownie import project
+
+
+PROJECT_PATH = Path(__file__).resolve().parents[1]
+
+
+def load_project(project_path=PROJECT_PATH):
+    """Return the active brownie project, loading it on first use.
+
+    Under ``brownie run`` / ``brownie test`` the already loaded project is
+    returned. Otherwise the project is loaded, and brownie recompiles only
+    the sources whose hash or compiler settings changed since the last build.
+    """
+    loaded = project.get_loaded_projects()
+    if loaded:
+        return loaded[0]
+    return project.load(str(project_path))
+
+
+class LazyContracts:
+    """Contract containers resolved on first attribute access.
+
+    Scripts import this instead of the containers themselves, so nothing is
+    loaded or compiled until a contract is actually used.
+    """
+
+    def __init__(self, project_path=PROJECT_PATH):
+        self._project_path = project_path
+        self._containers = {}
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name not in self._containers:
+            self._containers[name] = load_project(self._project_path)[name]
+        return self._containers[name]
+
+
+contracts = LazyContracts()
+
+
+def _timed_load(project_path):
+    for active in project.get_loaded_projects():
+        active.close()
+    start = time.perf_counter()
+    project.load(str(project_path))
+    return time.perf_counter() - start
+
+
+def measure_startup(project_path=PROJECT_PATH):
+    """Time project.load without build artifacts (full compile) and with them.
+
+    build/ is moved aside for the cold load and restored afterwards, replacing
+    the artifacts the cold load wrote.
+    """
+    build = Path(project_path) / "build"
+    with tempfile.TemporaryDirectory() as scratch:
+        saved = Path(scratch) / "build"
+        if build.exists():
+            shutil.move(str(build), str(saved))
+        try:
+            cold = _timed_load(project_path)
+        finally:
+            for active in project.get_loaded_projects():
+                active.close()
+            if saved.exists():
+                shutil.rmtree(build, ignore_errors=True)
+                shutil.move(str(saved), str(build))
+    warm = _timed_load(project_path)
+    return {"cold": cold, "warm": warm}
+
+
+def main():
+    """Report cold and warm project startup. Run as: python -m scripts.contract_loader"""
+    timings = measure_startup()
+    print(f"Cold startup (no build/): {timings['cold']:.3f}s")
+    print(f"Warm startup: {timings['warm']:.3f}s")
+    if timings["warm"]:
+        print(f"Speedup: {timings['cold'] / timings['warm']:.1f}x")
+    return timings
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,22 @@
-from brownie import accounts, SimpleStorage, web3 as w3
+from brownie import accounts
 
+from scripts.contract_loader import contracts
+from scripts.instrumentation import instrument, print_summary, wait_for
+from scripts.rpc_transport import install_transport
+from scripts.tx_scanner import scan_contract_transactions
 
+
+DEFAULT_PAGE_SIZE = 1000
+
+
+def iter_favorite_numbers(simple_storage, page_size=DEFAULT_PAGE_SIZE):
+    """Yield every stored favorite number, fetching ``page_size`` entries per call."""
+    total = simple_storage.count()
+    for offset in range(0, total, page_size):
+        yield from simple_storage.retrieveRange(offset, page_size)
+
+
+@instrument
 def deploy():
     """Deploy the SimpleStorage contract."""
     # Get the account to deploy from
@@ -10,7 +26,7 @@ def deploy():
 
     
     # Deploy the contract
-    simple_storage = SimpleStorage.deploy({"from": account})
+    simple_storage = contracts.SimpleStorage.deploy({"from": account})
     print(f"Contract deployed at: {simple_storage.address}")
     
     # Interact with the deployed contract
@@ -18,28 +34,26 @@ def deploy():
     
     # Store a value
     tx = simple_storage.store(42, {"from": account})
-    tx.wait(1)  # Wait for 1 confirmation
+    wait_for(tx, 1)  # Wait for 1 confirmation
     print(f"Stored value: {simple_storage.retrieve()}")
 
     tx = simple_storage.store(100, {"from": account})
-    tx.wait(1)  # Wait for 1 confirmation
+    wait_for(tx, 1)  # Wait for 1 confirmation
     print(f"Stored value: {simple_storage.retrieve()}")
-    print(f"All stored values: {simple_storage.retrieveAll()}")
+    print(f"All stored values: {list(iter_favorite_numbers(simple_storage))}")
 
     # get contract ABI
-    contract_factory = SimpleStorage
+    contract_factory = contracts.SimpleStorage
     print(f"Contract factory: {contract_factory}")
     contract_abi = simple_storage.abi
     print(f"Contract ABI: {contract_abi}")
     print(f"Contract bytecode: {contract_factory.bytecode}")
     
 
-    # Query blocks for transactions that include the contract address in the "to" field
-    block = w3.eth.get_block("latest")
-    for tx_hash in block.transactions:
-        tx = w3.eth.get_transaction(tx_hash)
-        if tx.to == simple_storage.address:
-            print(f"Found transaction to contract: {tx_hash}")
+    # Scan every block since deployment for transactions sent to the contract
+    deploy_block = simple_storage.tx.block_number
+    for tx in scan_contract_transactions(simple_storage.address, from_block=deploy_block):
+        print(f"Found transaction to contract: {tx['hash']} (block {tx['block']})")
 
 
     # Return the deployed contract
@@ -47,4 +61,6 @@ def deploy():
 
 
 def main():
-    deploy()
\ No newline at end of file
+    install_transport()
+    deploy()
+    print_summary()
\ No newline at end of file
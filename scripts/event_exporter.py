@@ -0,0 +1,177 @@
+import csv
+import os
+import time
+from pathlib import Path
+
+from brownie import chain, web3
+
+from scripts.chain_utils import decode_logs, event_decoders, to_hex
+from scripts.contract_loader import contracts
+
+
+EXPORTED_EVENTS = ("RoomBooked", "RoomsBooked", "RoomPaid", "RoomVacated", "databaseUpdated")
+BASE_COLUMNS = ("block_number", "tx_hash", "log_index")
+
+
+class CsvSink:
+    """One CSV file per event, rows appended as they arrive."""
+
+    suffix = "csv"
+
+    def __init__(self, path, columns):
+        self._file = open(path, "w", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(columns)
+
+    def write(self, rows):
+        self._writer.writerows(rows)
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetSink:
+    """One Parquet file per event; each chunk of rows becomes a row group.
+
+    Integers are written as decimal strings because uint256 values do not fit
+    any Parquet integer type.
+    """
+
+    suffix = "parquet"
+
+    def __init__(self, path, columns):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("Parquet export needs pyarrow: pip install pyarrow")
+        self._pa = pyarrow
+        self._schema = pyarrow.schema(
+            [("block_number", pyarrow.int64()), ("tx_hash", pyarrow.string()), ("log_index", pyarrow.int64())]
+            + [(column, pyarrow.string()) for column in columns[len(BASE_COLUMNS):]]
+        )
+        self._writer = pyarrow.parquet.ParquetWriter(str(path), self._schema)
+
+    def write(self, rows):
+        if not rows:
+            return
+        columns = list(zip(*rows))
+        arrays = [list(columns[0]), list(columns[1]), list(columns[2])]
+        arrays += [[None if value is None else str(value) for value in column] for column in columns[len(BASE_COLUMNS):]]
+        # explicit schema, so an all-null column is not inferred as a different type
+        self._writer.write_table(self._pa.Table.from_arrays(arrays, schema=self._schema))
+
+    def close(self):
+        self._writer.close()
+
+
+SINKS = {"csv": CsvSink, "parquet": ParquetSink}
+
+
+class EventExporter:
+    """Stream HostelManagement event history to columnar files.
+
+    Logs are fetched with eth_getLogs over block ranges that adapt to the
+    response size: a range that returns more than ``target_logs`` logs (or
+    that the node rejects) is halved, and one that returns fewer than a
+    quarter of the target is doubled, within ``min_chunk`` .. ``max_chunk``.
+    Rows from each range are written out immediately, so memory use is
+    bounded by one range rather than the whole history.
+    """
+
+    def __init__(self, contract, out_dir="exports", file_format="csv", chunk_size=2000,
+                 target_logs=5000, min_chunk=1, max_chunk=100000):
+        self.contract = contract
+        self.out_dir = Path(out_dir)
+        self.sink_class = SINKS[file_format]
+        self.chunk_size = chunk_size
+        self.target_logs = target_logs
+        self.min_chunk = min_chunk
+        self.max_chunk = max_chunk
+        self._decoders = event_decoders(contract, EXPORTED_EVENTS)
+        self._columns = {
+            name: BASE_COLUMNS + tuple(item["name"] for item in _event_abi(contract.abi, name)["inputs"])
+            for name in EXPORTED_EVENTS
+        }
+
+    def export(self, from_block=0, to_block=None):
+        """Write every exported event between the two blocks and return per-event row counts."""
+        to_block = chain.height if to_block is None else to_block
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        sinks = {
+            name: self.sink_class(self.out_dir / f"{name}.{self.sink_class.suffix}", self._columns[name])
+            for name in EXPORTED_EVENTS
+        }
+        counts = dict.fromkeys(EXPORTED_EVENTS, 0)
+        self.requests = 0
+        start = time.perf_counter()
+        try:
+            block = from_block
+            while block <= to_block:
+                end = min(block + self.chunk_size - 1, to_block)
+                logs = self._get_logs(block, end)
+                if logs is None:
+                    continue
+                rows = {name: [] for name in EXPORTED_EVENTS}
+                for log in decode_logs(self._decoders, logs):
+                    rows[log.event].append(
+                        (log.blockNumber, to_hex(log.transactionHash), log.logIndex)
+                        + tuple(log.args[column] for column in self._columns[log.event][len(BASE_COLUMNS):])
+                    )
+                for name, event_rows in rows.items():
+                    sinks[name].write(event_rows)
+                    counts[name] += len(event_rows)
+                self._resize(len(logs))
+                block = end + 1
+        finally:
+            for sink in sinks.values():
+                sink.close()
+        self.elapsed = time.perf_counter() - start
+        return counts
+
+    def _get_logs(self, from_block, to_block):
+        """Fetch one range; on a node error shrink the chunk and return None so the caller retries."""
+        self.requests += 1
+        try:
+            return web3.eth.get_logs({
+                "address": self.contract.address,
+                "fromBlock": from_block,
+                "toBlock": to_block,
+                "topics": [list(self._decoders)],
+            })
+        except Exception:
+            # nodes reject ranges with too many results or time out on them
+            if self.chunk_size <= self.min_chunk:
+                raise
+            self.chunk_size = max(self.min_chunk, self.chunk_size // 2)
+            return None
+
+    def _resize(self, log_count):
+        if log_count > self.target_logs:
+            self.chunk_size = max(self.min_chunk, self.chunk_size // 2)
+        elif log_count < self.target_logs // 4:
+            self.chunk_size = min(self.max_chunk, self.chunk_size * 2)
+
+
+def _event_abi(abi, name):
+    return next(item for item in abi if item.get("type") == "event" and item["name"] == name)
+
+
+def main():
+    """Export the latest HostelManagement's history.
+
+    EXPORT_FORMAT (csv or parquet, default csv), EXPORT_DIR (default exports)
+    and EXPORT_FROM_BLOCK (default: the contract's deployment block) configure the run.
+    """
+    contract = contracts.HostelManagement[-1]
+    deploy_block = contract.tx.block_number if contract.tx else 0
+    exporter = EventExporter(
+        contract,
+        out_dir=os.environ.get("EXPORT_DIR", "exports"),
+        file_format=os.environ.get("EXPORT_FORMAT", "csv"),
+    )
+    counts = exporter.export(from_block=int(os.environ.get("EXPORT_FROM_BLOCK", deploy_block)))
+    for name, count in counts.items():
+        print(f"{name}: {count} rows")
+    print(f"Exported in {exporter.elapsed:.2f}s using {exporter.requests} eth_getLogs calls")
+    return counts
@@ -0,0 +1,300 @@
+import sqlite3
+import time
+
+from brownie import chain, web3
+
+from scripts.chain_utils import chain_key, decode_logs, event_decoders, to_hex
+from scripts.contract_loader import contracts
+
+
+INDEXED_EVENTS = (
+    "RoomBooked",
+    "RoomsBooked",
+    "RoomVacated",
+    "RoomPaid",
+    "StudentDetailsUpdated",
+    "StudentSuspended",
+    "databaseUpdated",
+    "StudentRecordStored",
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    contract TEXT PRIMARY KEY,
+    chain TEXT NOT NULL,
+    last_block INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS events (
+    contract TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    tx_hash TEXT NOT NULL,
+    log_index INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    student TEXT,
+    PRIMARY KEY (tx_hash, log_index)
+);
+CREATE TABLE IF NOT EXISTS students (
+    contract TEXT NOT NULL,
+    address TEXT NOT NULL,
+    name TEXT,
+    age INTEGER,
+    gender TEXT,
+    contact TEXT,
+    home_address TEXT,
+    is_registered INTEGER NOT NULL DEFAULT 0,
+    has_room INTEGER NOT NULL DEFAULT 0,
+    is_suspended INTEGER NOT NULL DEFAULT 0,
+    suspension_reason TEXT,
+    PRIMARY KEY (contract, address)
+);
+CREATE TABLE IF NOT EXISTS payments (
+    contract TEXT NOT NULL,
+    tx_hash TEXT NOT NULL,
+    log_index INTEGER NOT NULL,
+    block_number INTEGER NOT NULL,
+    student TEXT NOT NULL,
+    amount TEXT NOT NULL,
+    PRIMARY KEY (tx_hash, log_index)
+);
+CREATE TABLE IF NOT EXISTS database_records (
+    contract TEXT NOT NULL,
+    tx_hash TEXT NOT NULL,
+    log_index INTEGER NOT NULL,
+    block_number INTEGER NOT NULL,
+    student TEXT NOT NULL,
+    name TEXT,
+    age INTEGER,
+    gender TEXT,
+    contact TEXT,
+    home_address TEXT,
+    room_price TEXT,
+    PRIMARY KEY (tx_hash, log_index)
+);
+CREATE TABLE IF NOT EXISTS student_records (
+    contract TEXT NOT NULL,
+    address TEXT NOT NULL,
+    record_hash TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    PRIMARY KEY (contract, address)
+);
+CREATE TABLE IF NOT EXISTS room_bookings (
+    contract TEXT NOT NULL,
+    tx_hash TEXT NOT NULL,
+    log_index INTEGER NOT NULL,
+    block_number INTEGER NOT NULL,
+    booker TEXT NOT NULL,
+    rooms INTEGER NOT NULL,
+    PRIMARY KEY (tx_hash, log_index)
+);
+CREATE INDEX IF NOT EXISTS payments_by_student ON payments (contract, student);
+"""
+
+
+class HostelIndexer:
+    """Tail HostelManagement events into a local SQLite database.
+
+    Events are applied in (block, log index) order to a set of projection
+    tables. The last processed block is stored per contract in the same
+    transaction as the rows it produced, so a restarted indexer resumes
+    exactly where it stopped. The checkpoint also records which chain it
+    belongs to (chain_utils.chain_key); when the chain was reset, the
+    contract's rows are dropped and it is indexed again from start_block.
+    """
+
+    def __init__(self, contract, db_path="hostel_index.db", batch_size=2000, start_block=0):
+        self.contract = contract
+        self.address = contract.address
+        self.batch_size = batch_size
+        self.start_block = start_block
+        self.db = sqlite3.connect(db_path)
+        columns = [row[1] for row in self.db.execute("PRAGMA table_info(checkpoints)")]
+        if columns and "chain" not in columns:
+            # index written before checkpoints recorded their chain: rebuild it
+            for (table,) in self.db.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall():
+                self.db.execute(f"DROP TABLE {table}")
+        self.db.executescript(SCHEMA)
+        self.chain = chain_key()
+        self._reset_if_other_chain()
+        self._decoders = event_decoders(contract, INDEXED_EVENTS)
+
+    def _reset_if_other_chain(self):
+        row = self.db.execute("SELECT chain FROM checkpoints WHERE contract = ?", (self.address,)).fetchone()
+        if row is None or row[0] == self.chain:
+            return
+        with self.db:
+            for table in ("checkpoints", "events", "students", "payments", "database_records", "student_records", "room_bookings"):
+                self.db.execute(f"DELETE FROM {table} WHERE contract = ?", (self.address,))
+
+    @property
+    def last_block(self):
+        row = self.db.execute("SELECT last_block FROM checkpoints WHERE contract = ?", (self.address,)).fetchone()
+        return row[0] if row else self.start_block - 1
+
+    def sync(self, to_block=None):
+        """Index every block after the checkpoint up to ``to_block`` (default: chain head).
+
+        Returns the number of events applied.
+        """
+        head = chain.height if to_block is None else to_block
+        applied = 0
+        from_block = self.last_block + 1
+        while from_block <= head:
+            end_block = min(from_block + self.batch_size - 1, head)
+            applied += self._index_range(from_block, end_block)
+            from_block = end_block + 1
+        return applied
+
+    def tail(self, poll_interval=2):
+        """Keep syncing new blocks until interrupted."""
+        while True:
+            applied = self.sync()
+            if applied:
+                print(f"Indexed {applied} events up to block {self.last_block}")
+            time.sleep(poll_interval)
+
+    def _index_range(self, from_block, to_block):
+        raw_logs = web3.eth.get_logs({
+            "address": self.address,
+            "fromBlock": from_block,
+            "toBlock": to_block,
+            "topics": [list(self._decoders)],
+        })
+        logs = decode_logs(self._decoders, raw_logs)
+        logs.sort(key=lambda log: (log.blockNumber, log.logIndex))
+
+        with self.db:
+            for log in logs:
+                self._apply(log)
+            self.db.execute(
+                "INSERT INTO checkpoints (contract, chain, last_block) VALUES (?, ?, ?) "
+                "ON CONFLICT (contract) DO UPDATE SET chain = excluded.chain, last_block = excluded.last_block",
+                (self.address, self.chain, to_block),
+            )
+        return len(logs)
+
+    def _apply(self, log):
+        args = log.args
+        tx_hash = to_hex(log.transactionHash)
+        student = args.student
+        inserted = self.db.execute(
+            "INSERT OR IGNORE INTO events VALUES (?, ?, ?, ?, ?, ?)",
+            (self.address, log.blockNumber, tx_hash, log.logIndex, log.event, student),
+        ).rowcount
+        if not inserted:
+            return
+
+        if log.event == "RoomBooked":
+            # emitted only on registration; registerStudentRecord's carries an empty name
+            self._upsert_student(student, args.studentName, args.studentAge, args.studentGender, args.studentContact, args.studentAddress)
+            self.db.execute(
+                "UPDATE students SET is_registered = 1, has_room = 1 WHERE contract = ? AND address = ?",
+                (self.address, student),
+            )
+        elif log.event == "RoomsBooked":
+            self.db.execute(
+                "INSERT INTO room_bookings VALUES (?, ?, ?, ?, ?, ?)",
+                (self.address, tx_hash, log.logIndex, log.blockNumber, student, args.numberOfRooms),
+            )
+        elif log.event == "RoomVacated":
+            self.db.execute(
+                "UPDATE students SET is_registered = 0, has_room = 0 WHERE contract = ? AND address = ?",
+                (self.address, student),
+            )
+        elif log.event == "RoomPaid":
+            self.db.execute(
+                "INSERT INTO payments VALUES (?, ?, ?, ?, ?, ?)",
+                (self.address, tx_hash, log.logIndex, log.blockNumber, student, str(args.amountPaid)),
+            )
+        elif log.event == "StudentDetailsUpdated":
+            self._upsert_student(student, args.studentName, args.studentAge, args.studentGender, args.studentContact, args.studentAddress)
+        elif log.event == "StudentSuspended":
+            self.db.execute(
+                "UPDATE students SET name = NULL, age = NULL, gender = NULL, contact = NULL, home_address = NULL, "
+                "is_registered = 0, has_room = 0, is_suspended = 1, suspension_reason = ? "
+                "WHERE contract = ? AND address = ?",
+                (args.reason, self.address, student),
+            )
+        elif log.event == "databaseUpdated":
+            self.db.execute(
+                "INSERT INTO database_records VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self.address, tx_hash, log.logIndex, log.blockNumber, student, args.studentName,
+                    args.studentAge, args.studentGender, args.studentContact, args.studentAddress,
+                    str(args.roomPricePerMonth),
+                ),
+            )
+        elif log.event == "StudentRecordStored":
+            self.db.execute(
+                "INSERT INTO student_records VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (contract, address) DO UPDATE SET record_hash = excluded.record_hash, "
+                "block_number = excluded.block_number",
+                (self.address, student, to_hex(args.recordHash), log.blockNumber),
+            )
+
+    def _upsert_student(self, student, name, age, gender, contact, home_address):
+        self.db.execute(
+            "INSERT INTO students (contract, address, name, age, gender, contact, home_address) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (contract, address) DO UPDATE SET name = excluded.name, age = excluded.age, "
+            "gender = excluded.gender, contact = excluded.contact, home_address = excluded.home_address",
+            (self.address, student, name, age, gender, contact, home_address),
+        )
+
+    def occupied_rooms(self):
+        """Rooms the index shows taken: students holding a room plus rooms taken with bookRooms."""
+        students = self.db.execute(
+            "SELECT COUNT(*) FROM students WHERE contract = ? AND has_room = 1", (self.address,)
+        ).fetchone()[0]
+        booked = self.db.execute(
+            "SELECT COALESCE(SUM(rooms), 0) FROM room_bookings WHERE contract = ?", (self.address,)
+        ).fetchone()[0]
+        return students + booked
+
+    def get_student(self, address):
+        """Return the indexed record for one student address, or None."""
+        cursor = self.db.execute(
+            "SELECT * FROM students WHERE contract = ? AND address = ?", (self.address, str(address))
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        return dict(zip((column[0] for column in cursor.description), row))
+
+    def get_residents(self):
+        """Addresses of every registered, unsuspended student."""
+        rows = self.db.execute(
+            "SELECT address FROM students WHERE contract = ? AND is_registered = 1 ORDER BY address",
+            (self.address,),
+        )
+        return [row[0] for row in rows]
+
+    def get_record_hash(self, address):
+        """Latest off-chain record hash indexed for a student, or None."""
+        row = self.db.execute(
+            "SELECT record_hash FROM student_records WHERE contract = ? AND address = ?", (self.address, str(address))
+        ).fetchone()
+        return row[0] if row else None
+
+    def total_paid(self, address=None):
+        """Sum of indexed RoomPaid amounts, for one student or the whole hostel."""
+        if address is None:
+            rows = self.db.execute("SELECT amount FROM payments WHERE contract = ?", (self.address,))
+        else:
+            rows = self.db.execute(
+                "SELECT amount FROM payments WHERE contract = ? AND student = ?", (self.address, str(address))
+            )
+        return sum(int(row[0]) for row in rows)
+
+    def close(self):
+        self.db.close()
+
+
+def main():
+    contract = contracts.HostelManagement[-1]
+    indexer = HostelIndexer(contract)
+    applied = indexer.sync()
+    print(f"Indexed {applied} events for {contract.address} up to block {indexer.last_block}")
+    print(f"Occupied Rooms: {indexer.occupied_rooms()}")
+    print(f"Residents: {len(indexer.get_residents())}")
+    print(f"Total Paid: {indexer.total_paid()}")
+    indexer.close()
@@ -1,9 +1,33 @@
-from brownie import HostelManagement, accounts
+import time
 
+from brownie import accounts
 
+from scripts.contract_loader import contracts
+from scripts.instrumentation import instrument, print_summary, wait_for
+from scripts.multicall import Multicall, deploy_multicall
+from scripts.packed_calldata import encode_hostel_student
+from scripts.receipts import send
+from scripts.rpc_transport import install_transport
+
+
+HOSTEL_SNAPSHOT_FIELDS = (
+    "school_name",
+    "hostel_name",
+    "location",
+    "hostel_manager",
+    "total_rooms",
+    "occupied_rooms",
+    "available_rooms",
+    "room_price",
+    "room_status",
+    "registered_students",
+)
+
+
+@instrument
 def deploy_hostel(school_name, hostel_name, location, hostel_manager, total_rooms, room_price, account):
     """Deploy a new hostel management contract."""
-    contract = HostelManagement.deploy(
+    contract = contracts.HostelManagement.deploy(
         school_name,
         hostel_name,
         location,
@@ -16,56 +40,224 @@ def deploy_hostel(school_name, hostel_name, location, hostel_manager, total_room
     return contract
 
 
-def register_student(student_name, age, gender, phone_number, address, account, contract_address=None):
-    """Register a student to an existing hostel contract."""
+@instrument
+def deploy_registry(account):
+    """Deploy a HostelManagement implementation and a HostelRegistry that clones it."""
+    implementation = deploy_hostel("", "Implementation", "", "", 0, 0, account)
+    registry = contracts.HostelRegistry.deploy(implementation.address, {"from": account})
+    print(f"Registry deployed at: {registry.address}")
+    return registry
+
+
+@instrument
+def deploy_hostels(batch, account, registry=None, per_transaction=10):
+    """Provision many hostels as minimal-proxy clones through a HostelRegistry.
+
+    ``batch`` is a list of (school_name, hostel_name, location, hostel_manager,
+    total_rooms, room_price) tuples. Up to ``per_transaction`` hostels are
+    created per createHostels transaction. Returns the hostel contracts and a
+    stats dict with deployment gas and time per hostel.
+    """
+    if registry is None:
+        registry = deploy_registry(account)
+
+    hostels = []
+    total_gas = 0
+    start = time.time()
+    for offset in range(0, len(batch), per_transaction):
+        configs = batch[offset:offset + per_transaction]
+        tx = wait_for(registry.createHostels(configs, {"from": account}))
+        total_gas += tx.gas_used
+        for event in tx.events["HostelCreated"]:
+            hostels.append(contracts.HostelManagement.at(event["hostel"]))
+            print(f"Hostel {event['hostelName']} deployed at: {event['hostel']}")
+
+    elapsed = time.time() - start
+    stats = {
+        "hostels": len(hostels),
+        "transactions": -(-len(batch) // per_transaction),
+        "gas_per_hostel": total_gas / len(hostels) if hostels else 0,
+        "seconds_per_hostel": elapsed / len(hostels) if hostels else 0,
+    }
+    print(f"Deployed {stats['hostels']} hostels in {stats['transactions']} transactions")
+    print(f"Gas per hostel: {stats['gas_per_hostel']:.0f}")
+    print(f"Time per hostel: {stats['seconds_per_hostel']:.3f}s")
+    return hostels, stats
+
+
+@instrument
+def register_student(student_name, age, gender, phone_number, address, account, contract_address=None, blocking=True, contract=None):
+    """Register a student to an existing hostel contract.
+
+    Pass ``contract`` when the caller already holds the contract object, to
+    skip looking it up from ``contract_address``. With ``blocking=False`` the
+    transaction is only broadcast and a Future that resolves to the receipt
+    is returned instead of the contract.
+    """
     
     # If contract address is provided, use existing contract
-    if contract_address:
-        contract = HostelManagement.at(contract_address)
+    if contract is None:
+        if not contract_address:
+            raise ValueError("Contract address is required. Please deploy a hostel contract first using deploy_hostel()")
+        contract = contracts.HostelManagement.at(contract_address)
         print(f"Using existing contract at: {contract.address}")
-    else:
-        raise ValueError("Contract address is required. Please deploy a hostel contract first using deploy_hostel()")
     
     # Register the student
     print(f"\nRegistering student: {student_name}")
-    tx = contract.registerStudent(
+    tx = send(
+        contract.registerStudent,
         student_name,
         age,
         gender,
         phone_number,
         address,
-        {"from": account}
+        tx_params={"from": account},
+        blocking=blocking
     )
-    tx.wait(1)
+    if not blocking:
+        print(f"Registration submitted for {student_name}")
+        return tx
     
-    # Verify registration
-    student_details = contract.getStudentDetails()
+    # Verify registration (student and hostel state in one eth_call)
+    batch = Multicall()
+    batch.add(contract.getStudentDetailsByAddress, account)
+    batch.add(contract.getHostelSnapshot)
+    student_details, snapshot = batch.call()
+    snapshot = dict(zip(HOSTEL_SNAPSHOT_FIELDS, snapshot))
     print(f"\n\n\n\n\n✅ Student registered successfully!")
     print(f"Name: {student_details[0]}")
     print(f"Age: {student_details[1]}")
     print(f"Gender: {student_details[2]}")
     print(f"Contact: {student_details[3]}")
     print(f"Address: {student_details[4]}")
-    print(f"\nRoom Status: {contract.getRoomStatus()}")
-    print(f"Available Rooms: {contract.availableRooms()}")
-    print(f"Occupied Rooms: {contract.occupiedRooms()}")
+    print(f"\nRoom Status: {snapshot['room_status']}")
+    print(f"Available Rooms: {snapshot['available_rooms']}")
+    print(f"Occupied Rooms: {snapshot['occupied_rooms']}")
     
     return contract
 
 
-def vacate_room(contract, student_name, account):
+@instrument
+def register_student_packed(contract, student_name, age, gender, phone_number, address, account, blocking=True):
+    """Register a student through registerStudentPacked, sending the details as one packed payload."""
+    payload = encode_hostel_student(student_name, age, gender, phone_number, address)
+    print(f"\nRegistering student {student_name} ({len(payload)}-byte payload)")
+    tx = send(contract.registerStudentPacked, payload, tx_params={"from": account}, blocking=blocking)
+    if blocking:
+        print(f"Student {student_name} registered successfully.")
+    return tx
+
+
+@instrument
+def register_student_record(contract, store, student_name, age, gender, phone_number, address, account, blocking=True):
+    """Register a student on-chain by record hash, keeping the personal details in ``store``."""
+    record = {"name": student_name, "gender": gender, "contact": phone_number, "address": address}
+    record_hash = store.put(record)
+    print(f"\nRegistering student {student_name} with record {record_hash}")
+    tx = send(contract.registerStudentRecord, record_hash, age, tx_params={"from": account}, blocking=blocking)
+    if blocking:
+        print(f"Student record stored for {account}")
+    return tx
+
+
+@instrument
+def get_student_record(contract, store, student):
+    """Resolve a student's on-chain record hash to the full record held in ``store``."""
+    record_hash = contract.getStudentRecordHash(student)
+    if not any(bytes(record_hash)):
+        print(f"No off-chain record for {student}")
+        return None
+    record = store.get(record_hash)
+    print(f"Student Record: {record}")
+    return record
+
+
+@instrument
+def create_resident_accounts(count, funder, amount):
+    """Create and fund local accounts so each resident can sign for their own record."""
+    residents = []
+    for _ in range(count):
+        resident = accounts.add()
+        funder.transfer(resident, amount)
+        residents.append(resident)
+    print(f"Created {count} funded resident accounts")
+    return residents
+
+
+@instrument
+def register_residents(contract, residents):
+    """Register many residents against one contract.
+
+    ``residents`` is a list of (account, name, age, gender, contact, address) tuples.
+    Each resident's record is stored under its own account address. The
+    registrations come from different senders, so they are submitted together
+    and confirmed in the background.
+    """
+    futures = [
+        send(contract.registerStudent, student_name, age, gender, contact, address, tx_params={"from": account}, blocking=False)
+        for account, student_name, age, gender, contact, address in residents
+    ]
+    for future in futures:
+        tx = future.result()
+        print(f"Registered resident: {tx.events['RoomBooked']['studentName']} ({tx.sender})")
+    snapshot = get_hostel_snapshot(contract)
+    print(f"\nRegistered Students: {snapshot['registered_students']}")
+    print(f"Available Rooms: {snapshot['available_rooms']}")
+    print(f"Occupied Rooms: {snapshot['occupied_rooms']}")
+    return contract
+
+
+@instrument
+def get_hostel_snapshot(contract):
+    """Read the hostel's counters and details with a single getHostelSnapshot call."""
+    return dict(zip(HOSTEL_SNAPSHOT_FIELDS, contract.getHostelSnapshot()))
+
+
+@instrument
+def get_room_map(contract, total_rooms=None):
+    """Rebuild the per-room occupancy map from the contract's bitmap in one call.
+
+    Returns a list where index ``n - 1`` is True while room ``n`` is taken.
+    """
+    if total_rooms is None:
+        total_rooms = contract.totalRooms()
+    words = contract.getOccupancyBitmap(0, (total_rooms + 255) // 256)
+    return [bool((words[room // 256] >> (room % 256)) & 1) for room in range(total_rooms)]
+
+
+@instrument
+def get_dashboard(contract, students):
+    """Fetch the hostel snapshot and every listed student's details in one RPC round trip."""
+    batch = Multicall()
+    batch.add(contract.getHostelSnapshot)
+    for student in students:
+        batch.add(contract.getStudentDetailsByAddress, student)
+    snapshot, *details = batch.call()
+    return {
+        "hostel": dict(zip(HOSTEL_SNAPSHOT_FIELDS, snapshot)),
+        "students": dict(zip((str(student) for student in students), details)),
+    }
+
+
+@instrument
+def vacate_room(contract, student_name, account, blocking=True):
     """Vacate a room"""
     print("\n\n\n\nvacating room for student:", student_name)
-    tx = contract.vacateRoom({"from": account})
-    tx.wait(1)
-    print(f"\n\n\n\nRoom vacated for student: {student_name}")
+    tx = send(contract.vacateRoom, tx_params={"from": account}, blocking=blocking)
+    if blocking:
+        print(f"\n\n\n\nRoom vacated for student: {student_name}")
+    return tx
 
 
 
-def get_student_details(contract):
-    """Retrieve student details from the contract."""
+@instrument
+def get_student_details(contract, student=None):
+    """Retrieve student details from the contract, optionally for a specific student address."""
     print("\n\n\n\nFetching student details...")
-    details = contract.getStudentDetails()
+    if student is None:
+        details = contract.getStudentDetails()
+    else:
+        details = contract.getStudentDetailsByAddress(student)
     if details[0] == "":
         print("No student is currently registered.")
     else:
@@ -74,45 +266,76 @@ def get_student_details(contract):
 
 
 
-def make_payment(contract, amount, account):
+@instrument
+def make_payment(contract, amount, account, blocking=True):
     """Make a payment for room rent."""
     print(f"\n\n\n\nMaking payment of {amount}...")
-    tx = contract.makePayment({"from": account, "value": amount})
-    tx.wait(1)
-    print(f"Payment of {amount} made successfully.")
+    tx = send(contract.makePayment, tx_params={"from": account, "value": amount}, blocking=blocking)
+    if blocking:
+        print(f"Payment of {amount} made successfully.")
+    return tx
+
+
+@instrument
+def make_payments(contract, payments):
+    """Submit rent payments from several accounts at once and wait for all receipts.
+
+    ``payments`` is a list of (account, amount) pairs.
+    """
+    futures = [make_payment(contract, amount, account, blocking=False) for account, amount in payments]
+    receipts = [future.result() for future in futures]
+    print(f"{len(receipts)} payments confirmed.")
+    return receipts
+
+
+@instrument
+def withdraw_payments(contract, account, blocking=True):
+    """Collect all accrued rent into the hostel wallet."""
+    amount = contract.getAccruedPayments()
+    print(f"\n\n\n\nWithdrawing {amount} in accrued payments...")
+    tx = send(contract.withdrawPayments, tx_params={"from": account}, blocking=blocking)
+    if blocking:
+        print(f"Withdrew {amount} to {contract.getHostelWallet()}.")
     return tx
 
 
 
-def update_hostel_details(contract, school_name, hostel_name, location, hostel_manager, total_rooms, room_price, account):
+@instrument
+def update_hostel_details(contract, school_name, hostel_name, location, hostel_manager, total_rooms, room_price, account, blocking=True):
     """Update hostel details."""
     print("\n\n\n\nUpdating hostel details...")
-    tx = contract.updateHostelDetails(
+    tx = send(
+        contract.updateHostelDetails,
         school_name,
         hostel_name,
         location,
         hostel_manager,
         total_rooms,
         room_price,
-        {"from": account}
+        tx_params={"from": account},
+        blocking=blocking
     )
-    tx.wait(1)
-    print("Hostel details updated successfully.")
+    if blocking:
+        print("Hostel details updated successfully.")
     return tx
 
 
-def update_student_details(contract, student_name, age, gender, contact, address, account):
+@instrument
+def update_student_details(contract, student_name, age, gender, contact, address, account, blocking=True):
     """Update a student Detail"""
     print("\n\n\n\nUpdating student details...")
-    tx = contract.updateStudentDetails(
+    tx = send(
+        contract.updateStudentDetails,
         student_name,
         age,
         gender,
         contact,
         address,
-        {"from": account}
+        tx_params={"from": account},
+        blocking=blocking
     )
-    tx.wait(1)
+    if not blocking:
+        return tx
     print("Student details updated successfully.")
     print(f"Name: {student_name}")
     print(f"Age: {age}")
@@ -123,43 +346,55 @@ def update_student_details(contract, student_name, age, gender, contact, address
 
 
 
-def suspend_student(contract, student_name, reason, account):
-    """Suspend a student"""
+@instrument
+def suspend_student(contract, student, reason, account, blocking=True):
+    """Suspend the student registered at the given address"""
     print("\n\n\n\nSuspending student...")
-    tx = contract.suspendStudent(
-        student_name,
+    tx = send(
+        contract.suspendStudent,
+        student,
         reason,
-        {"from": account}
+        tx_params={"from": account},
+        blocking=blocking
     )
-    tx.wait(1)
-    print(f"Student {student_name} suspended successfully.")
+    if not blocking:
+        return tx
+    print(f"Student {student} suspended successfully.")
     print(f"Reason: {reason}")
     return tx
 
 
 
-def book_room(contract, number_of_rooms, account):
+@instrument
+def book_room(contract, number_of_rooms, account, blocking=True):
     """Book a room"""
     print(f"\n\n\n\nBooking {number_of_rooms} room(s)...")
-    tx = contract.bookRooms(number_of_rooms, {"from": account})
-    tx.wait(1)
+    tx = send(contract.bookRooms, number_of_rooms, tx_params={"from": account}, blocking=blocking)
+    if not blocking:
+        return tx
     print(f"{number_of_rooms} room(s) booked successfully.")
-    print(f"Available Rooms: {contract.availableRooms()}")
-    print(f"Occupied Rooms: {contract.occupiedRooms()}")
+    snapshot = get_hostel_snapshot(contract)
+    print(f"Available Rooms: {snapshot['available_rooms']}")
+    print(f"Occupied Rooms: {snapshot['occupied_rooms']}")
     return tx
 
 
-def store_in_database(contract, account):
+@instrument
+def store_in_database(contract, account, blocking=True):
     """Store current student details in the database."""
     print("\n\n\n\nStoring student details in database...")
-    tx = contract.storeInDataBase({"from": account})
-    tx.wait(1)
-    print("Student details stored in database successfully.")
+    tx = send(contract.storeInDataBase, tx_params={"from": account}, blocking=blocking)
+    if blocking:
+        print("Student details stored in database successfully.")
     return tx
 
 
 
 def main():
+    install_transport()
+    # Batch the read-backs below into single eth_calls on local chains
+    deploy_multicall(accounts[0])
+
     # Deploy the hostel contract
     contract = deploy_hostel(
         school_name="University of Lagos",
@@ -182,8 +417,14 @@ def main():
         contract_address=contract.address
     )
 
+    # Register more residents against the same contract
+    register_residents(contract, [
+        (accounts[1], "Ada", 19, "Female", "1112223333", "12 Marina Rd"),
+        (accounts[2], "Tunde", 22, "Male", "4445556666", "7 Allen Ave"),
+    ])
+
     # Get student details
-    get_student_details(contract)
+    get_student_details(contract, accounts[0])
 
     # Make payment
     make_payment(
@@ -192,6 +433,9 @@ def main():
         account=accounts[0]
     )
 
+    # Collect the accrued rent (the deployer is the hostel wallet)
+    withdraw_payments(contract, accounts[0])
+
     # Update hostel details
     update_hostel_details(
         contract=contract,
@@ -216,7 +460,7 @@ def main():
     )
 
     # Suspend student (this will automatically vacate the room)
-    # Note: The student name must match the current student in the contract
+    # Note: Students are looked up by the address they registered from
     # Store in database (before suspension, while student data still exists)
     store_in_database(
         contract=contract,
@@ -226,15 +470,21 @@ def main():
     # Suspend student
     suspend_student(
         contract=contract,
-        student_name="Evidence Ejimone",
+        student=accounts[0],
         reason="Violation of hostel rules",
         account=accounts[0]
     )
 
+    # Show which rooms are taken
+    room_map = get_room_map(contract)
+    print(f"\n\n\n\nOccupied room numbers: {[room + 1 for room, taken in enumerate(room_map) if taken]}")
+
     # Verify student was cleared after suspension
     print("\n\n\n\nVerifying student details after suspension...")
-    final_details = contract.getStudentDetails()
+    dashboard = get_dashboard(contract, [accounts[0]])
+    final_details = dashboard["students"][str(accounts[0])]
     print(f"Student Name: {final_details[0] if final_details[0] else '(Empty - Student suspended)'}")
-    print(f"Available Rooms: {contract.availableRooms()}")
-    print(f"Occupied Rooms: {contract.occupiedRooms()}")
+    print(f"Available Rooms: {dashboard['hostel']['available_rooms']}")
+    print(f"Occupied Rooms: {dashboard['hostel']['occupied_rooms']}")
     print(f"\n✅ All hostel management functions have been successfully demonstrated!")
+    print_summary()
@@ -0,0 +1,200 @@
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from brownie import web3
+from brownie.network import history
+
+
+METRICS_DIR = Path(os.environ.get("METRICS_DIR", "metrics"))
+JSONL_PATH = METRICS_DIR / "operations.jsonl"
+PROMETHEUS_PATH = METRICS_DIR / "operations.prom"
+
+PROMETHEUS_METRICS = (
+    ("calls", "hostel_operation_calls_total", "counter", "Helper calls"),
+    ("errors", "hostel_operation_errors_total", "counter", "Helper calls that raised"),
+    ("wall_time", "hostel_operation_wall_seconds_total", "counter", "Wall time spent in the helper"),
+    ("rpc_calls", "hostel_operation_rpc_requests_total", "counter", "JSON-RPC requests made by the helper; batched requests share HTTP round trips"),
+    ("gas_used", "hostel_operation_gas_used_total", "counter", "Gas used by transactions the helper confirmed"),
+    ("confirmation_wait", "hostel_operation_confirmation_wait_seconds_total", "counter", "Time spent waiting for confirmations"),
+)
+
+_lock = threading.Lock()
+_local = threading.local()
+_records = []
+_flushed = 0
+_registered = False
+
+SEND_METHODS = ("eth_sendTransaction", "eth_sendRawTransaction")
+MIDDLEWARE_NAME = "hostel_instrumentation"
+
+
+def _active():
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
+
+
+def _request_counter(make_request, w3):
+    """web3 middleware that counts every JSON-RPC request against the active operations.
+
+    The hash of every transaction sent is also noted on the sending thread's
+    operations, so gas is only charged to the operation that sent it.
+    """
+    def counted(method, params):
+        stack = _active()
+        for record in stack:
+            record["rpc_calls"] += 1
+        response = make_request(method, params)
+        if method in SEND_METHODS and stack and isinstance(response.get("result"), str):
+            for record in stack:
+                record["_sent"].add(response["result"].lower())
+        return response
+    return counted
+
+
+def _count_requests():
+    """Install the request counter as the innermost web3 middleware, once.
+
+    web3 caches the composed request function, so patching the provider's
+    make_request would be bypassed; a middleware is part of that function,
+    sees only requests that reach the provider, and survives provider swaps
+    such as rpc_transport.install_transport.
+    """
+    with _lock:
+        if MIDDLEWARE_NAME not in web3.middleware_onion:
+            web3.middleware_onion.inject(_request_counter, name=MIDDLEWARE_NAME, layer=0)
+
+
+@contextmanager
+def operation(name):
+    """Record wall time, JSON-RPC requests, gas and confirmation wait for a block of work.
+
+    Operations nest: an RPC made inside an inner operation also counts
+    towards every enclosing one on the same thread. Gas is charged only for
+    transactions this thread sent or waited on, so concurrent operations on
+    other threads do not leak into the record.
+    """
+    global _registered
+    _count_requests()
+    record = {
+        "operation": name,
+        "timestamp": time.time(),
+        "wall_time": 0.0,
+        "rpc_calls": 0,
+        "gas_used": 0,
+        "confirmation_wait": 0.0,
+        "transactions": 0,
+        "error": None,
+        "_seen": set(),
+        "_sent": set(),
+    }
+    first_tx = len(history)
+    stack = _active()
+    stack.append(record)
+    start = time.perf_counter()
+    try:
+        yield record
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        record["wall_time"] = time.perf_counter() - start
+        stack.pop()
+        # transactions this thread sent inside the call but did not pass to
+        # wait_for, e.g. plain brownie calls that wait for their own confirmation
+        for tx in history[first_tx:]:
+            txid = tx.txid.lower()
+            if txid in record["_sent"] and txid not in record["_seen"] and tx.gas_used is not None:
+                record["gas_used"] += tx.gas_used
+                record["transactions"] += 1
+        del record["_seen"], record["_sent"]
+        with _lock:
+            _records.append(record)
+            if not _registered:
+                atexit.register(flush)
+                _registered = True
+
+
+def instrument(func):
+    """Decorator that records every call of a script helper as an operation."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with operation(f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def wait_for(tx, confirmations=1):
+    """Wait for ``tx`` and charge the wait and its gas to the active operations."""
+    start = time.perf_counter()
+    tx.wait(confirmations)
+    waited = time.perf_counter() - start
+    txid = tx.txid.lower()
+    for record in _active():
+        record["confirmation_wait"] += waited
+        if txid not in record["_seen"]:
+            record["_seen"].add(txid)
+            record["gas_used"] += tx.gas_used or 0
+            record["transactions"] += 1
+    return tx
+
+
+def summarize(records=None):
+    """Aggregate records per operation name."""
+    totals = {}
+    for record in _records if records is None else records:
+        entry = totals.setdefault(record["operation"], {key: 0 for key, *_ in PROMETHEUS_METRICS})
+        entry["calls"] += 1
+        entry["errors"] += record["error"] is not None
+        for key in ("wall_time", "rpc_calls", "gas_used", "confirmation_wait"):
+            entry[key] += record[key]
+    return totals
+
+
+def flush(jsonl_path=JSONL_PATH, prometheus_path=PROMETHEUS_PATH):
+    """Append new records to the JSON-lines log and rewrite the Prometheus text file."""
+    global _flushed
+    with _lock:
+        new_records = _records[_flushed:]
+        _flushed = len(_records)
+        totals = summarize(list(_records))
+    if not totals:
+        return
+    Path(jsonl_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(jsonl_path, "a") as f:
+        for record in new_records:
+            f.write(json.dumps(record) + "\n")
+
+    lines = []
+    for key, metric, kind, description in PROMETHEUS_METRICS:
+        lines.append(f"# HELP {metric} {description}")
+        lines.append(f"# TYPE {metric} {kind}")
+        for name, entry in sorted(totals.items()):
+            lines.append(f'{metric}{{operation="{name}"}} {entry[key]}')
+    Path(prometheus_path).parent.mkdir(parents=True, exist_ok=True)
+    Path(prometheus_path).write_text("\n".join(lines) + "\n")
+
+
+def print_summary():
+    """Print the operations ranked by total wall time.
+
+    The rpc column counts JSON-RPC requests. With the BatchingHTTPProvider
+    installed several requests share one HTTP round trip, so the transport's
+    own round-trip count is printed underneath.
+    """
+    totals = summarize()
+    print(f"{'operation':<36} {'calls':>6} {'wall s':>9} {'rpc req':>8} {'gas':>12} {'wait s':>9}")
+    for name, entry in sorted(totals.items(), key=lambda item: -item[1]["wall_time"]):
+        print(
+            f"{name:<36} {entry['calls']:>6} {entry['wall_time']:>9.3f} {entry['rpc_calls']:>8} "
+            f"{entry['gas_used']:>12} {entry['confirmation_wait']:>9.3f}"
+        )
+    provider = web3.provider
+    if hasattr(provider, "round_trips"):
+        print(f"HTTP round trips: {provider.round_trips} for {provider.requests_sent} JSON-RPC requests")
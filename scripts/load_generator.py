@@ -0,0 +1,221 @@
+import contextlib
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from brownie import accounts
+
+from scripts.hostel_management_deploy import (
+    create_resident_accounts,
+    deploy_hostel,
+    make_payment,
+    register_student,
+    store_in_database,
+    suspend_student,
+    update_student_details,
+    vacate_room,
+)
+from scripts.receipts import ReceiptCollector, set_collector
+
+
+REPORT_PATH = Path("reports") / "load_test.json"
+ROOM_PRICE = 50000
+# Probability that a resident performs each step after registering
+DEFAULT_MIX = {"pay": 1.0, "update": 0.3, "store": 0.5, "suspend": 0.05, "vacate": 0.2}
+OPERATIONS = ("register", "pay", "update", "store", "suspend", "vacate")
+
+
+def parse_mix(text):
+    """Parse "pay=1,update=0.3,..." into a mix dict, keeping defaults for steps not listed."""
+    mix = dict(DEFAULT_MIX)
+    for item in filter(None, text.split(",")):
+        step, probability = item.split("=")
+        if step not in DEFAULT_MIX:
+            raise ValueError(f"Unknown step in mix: {step}")
+        mix[step] = float(probability)
+    return mix
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, max(0, int(round(fraction * len(values))) - 1))]
+
+
+class LoadGenerator:
+    """Drive many simulated residents through the hostel lifecycle concurrently.
+
+    Each resident registers, then pays, updates their details, stores a
+    database record and finally is suspended or vacates, each step taken with
+    the probability given in ``mix``. Steps go through the same helpers as
+    ``hostel_management_deploy.main`` and every call is timed from
+    submission to confirmed receipt.
+
+    Suspensions are sent by ``funder``, which deployed the hostels and so is
+    their hostel wallet, the only account allowed to suspend a resident.
+
+    Student records are keyed by address, so an account can only live once
+    in a hostel. Residents are spread over ``ceil(residents / pool_size)``
+    hostels, so the same account pool is reused across hostels.
+    """
+
+    def __init__(self, residents=1000, concurrency=16, pool_size=200, mix=None, seed=0, funder=None):
+        self.residents = residents
+        self.concurrency = concurrency
+        self.pool_size = min(pool_size, residents)
+        self.mix = mix or dict(DEFAULT_MIX)
+        self.funder = funder or accounts[0]
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.samples = {operation: [] for operation in OPERATIONS}
+        self.errors = {operation: 0 for operation in OPERATIONS}
+
+    def setup(self):
+        """Deploy the hostels and fund the sender pool."""
+        hostel_count = -(-self.residents // self.pool_size)
+        self.hostels = [
+            deploy_hostel("Load Test University", f"Hall {i}", "Campus", "Manager", self.pool_size, ROOM_PRICE, self.funder)
+            for i in range(hostel_count)
+        ]
+        self.pool = create_resident_accounts(self.pool_size, self.funder, "1 ether")
+        # Decide every resident's steps up front so runs with the same seed are comparable
+        self.plans = [
+            {step: self._random.random() < probability for step, probability in self.mix.items()}
+            for _ in range(self.residents)
+        ]
+
+    def _timed(self, operation, submit):
+        start = time.perf_counter()
+        try:
+            tx = submit().result()
+        except Exception:
+            with self._lock:
+                self.errors[operation] += 1
+            return False
+        latency = time.perf_counter() - start
+        with self._lock:
+            self.samples[operation].append((latency, tx.gas_used))
+        return True
+
+    def _lifecycle(self, index):
+        contract = self.hostels[index // self.pool_size]
+        account = self.pool[index % self.pool_size]
+        plan = self.plans[index]
+        name = f"Resident{index}"
+
+        registered = self._timed("register", lambda: register_student(
+            name, 18 + index % 10, "Female" if index % 2 else "Male", f"080{index:08d}", "Campus",
+            account, blocking=False, contract=contract,
+        ))
+        if not registered:
+            return
+        if plan["pay"]:
+            self._timed("pay", lambda: make_payment(contract, ROOM_PRICE, account, blocking=False))
+        if plan["update"]:
+            self._timed("update", lambda: update_student_details(
+                contract, f"{name} Updated", 19 + index % 10, "Female", f"081{index:08d}", "Town", account, blocking=False,
+            ))
+        if plan["store"]:
+            self._timed("store", lambda: store_in_database(contract, account, blocking=False))
+        if plan["suspend"]:
+            self._timed("suspend", lambda: suspend_student(contract, account, "Load test", self.funder, blocking=False))
+        elif plan["vacate"]:
+            self._timed("vacate", lambda: vacate_room(contract, name, account, blocking=False))
+
+    def _run_account(self, slot):
+        # one account's residents run back to back, so a resident account never has two transactions
+        # in flight; the funder's suspensions may overlap, but brownie assigns nonces under a per-account lock
+        for index in range(slot, self.residents, self.pool_size):
+            self._lifecycle(index)
+
+    def run(self):
+        """Run every lifecycle and return the report.
+
+        Confirmations go through a collector with one worker per lifecycle
+        thread, so no lifecycle queues behind another's receipt and the
+        latency percentiles measure the chain rather than the pool.
+        """
+        collector = ReceiptCollector(max_workers=self.concurrency)
+        previous = set_collector(collector)
+        start = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                list(executor.map(self._run_account, range(self.pool_size)))
+            wall_time = time.perf_counter() - start
+        finally:
+            set_collector(previous)
+            collector.shutdown()
+        return self.report(wall_time)
+
+    def report(self, wall_time):
+        operations = {}
+        for operation in OPERATIONS:
+            samples = self.samples[operation]
+            if not samples and not self.errors[operation]:
+                continue
+            latencies = sorted(latency for latency, _ in samples)
+            operations[operation] = {
+                "count": len(samples),
+                "errors": self.errors[operation],
+                "throughput": len(samples) / wall_time if wall_time else 0.0,
+                "p50": percentile(latencies, 0.50),
+                "p95": percentile(latencies, 0.95),
+                "p99": percentile(latencies, 0.99),
+                "gas_mean": sum(gas for _, gas in samples) / len(samples) if samples else 0,
+            }
+        total = sum(entry["count"] for entry in operations.values())
+        return {
+            "residents": self.residents,
+            "concurrency": self.concurrency,
+            "pool_size": self.pool_size,
+            "hostels": len(self.hostels),
+            "mix": self.mix,
+            "wall_time": wall_time,
+            "throughput": total / wall_time if wall_time else 0.0,
+            "operations": operations,
+        }
+
+
+def print_report(report):
+    print(f"\n{report['residents']} residents, concurrency {report['concurrency']}, "
+          f"{report['pool_size']} accounts over {report['hostels']} hostel(s)")
+    print(f"{'operation':<10} {'ok':>6} {'err':>5} {'tx/s':>8} {'p50 s':>8} {'p95 s':>8} {'p99 s':>8} {'gas':>9}")
+    for operation, entry in report["operations"].items():
+        print(
+            f"{operation:<10} {entry['count']:>6} {entry['errors']:>5} {entry['throughput']:>8.2f} "
+            f"{entry['p50']:>8.3f} {entry['p95']:>8.3f} {entry['p99']:>8.3f} {entry['gas_mean']:>9.0f}"
+        )
+    print(f"Overall: {report['throughput']:.2f} tx/s over {report['wall_time']:.1f}s")
+
+
+def main():
+    """Run a load test against the active network.
+
+    Configured through environment variables:
+    LOAD_RESIDENTS (default 1000), LOAD_CONCURRENCY (default 16),
+    LOAD_POOL_SIZE (sender accounts, default 200), LOAD_SEED (default 0),
+    LOAD_MIX (e.g. "pay=1,update=0.3,store=0.5,suspend=0.05,vacate=0.2") and
+    LOAD_VERBOSE=1 to keep the helpers' per-call output.
+    """
+    generator = LoadGenerator(
+        residents=int(os.environ.get("LOAD_RESIDENTS", 1000)),
+        concurrency=int(os.environ.get("LOAD_CONCURRENCY", 16)),
+        pool_size=int(os.environ.get("LOAD_POOL_SIZE", 200)),
+        mix=parse_mix(os.environ.get("LOAD_MIX", "")),
+        seed=int(os.environ.get("LOAD_SEED", 0)),
+    )
+    quiet = os.environ.get("LOAD_VERBOSE") != "1"
+    with open(os.devnull, "w") as sink:
+        with contextlib.redirect_stdout(sink) if quiet else contextlib.nullcontext():
+            generator.setup()
+            report = generator.run()
+    print_report(report)
+    REPORT_PATH.parent.mkdir(exist_ok=True)
+    REPORT_PATH.write_text(json.dumps(report, indent=2))
+    print(f"Report written to {REPORT_PATH}")
+    return report
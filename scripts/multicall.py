@@ -0,0 +1,81 @@
+from brownie import config, network
+
+from scripts.contract_loader import contracts
+
+
+# Network ids (and id prefixes) of local chains, where deploying a Multicall is free
+LOCAL_NETWORKS = ("development", "ganache")
+
+
+def get_multicall():
+    """Return a Multicall contract for the active chain, or None when there is none.
+
+    A Multicall deployed in this session is used first, then the address
+    configured as ``multicall2`` for the active network in brownie's network
+    config. Nothing is ever deployed here, since read helpers must not spend
+    gas; on local chains, deploy one first with deploy_multicall.
+    """
+    if len(contracts.Multicall) > 0:
+        return contracts.Multicall[-1]
+    address = config["networks"].get(network.show_active(), {}).get("multicall2")
+    if address:
+        return contracts.Multicall.at(address)
+    return None
+
+
+def is_local_network():
+    """Return True when the active network is a local chain rather than a live one."""
+    active = network.show_active()
+    return active.startswith(LOCAL_NETWORKS) or "cmd" in config["networks"].get(active, {})
+
+
+def deploy_multicall(account):
+    """Make a Multicall available to get_multicall on a local chain.
+
+    Deploys one from ``account`` when the chain has none yet. On live
+    networks nothing is deployed; configure ``multicall2`` there instead.
+    Returns the Multicall contract, or None when there is none.
+    """
+    multicall = get_multicall()
+    if multicall is None and is_local_network():
+        multicall = contracts.Multicall.deploy({"from": account})
+        print(f"Multicall deployed at: {multicall.address}")
+    return multicall
+
+
+class Multicall:
+    """Aggregate view calls on any contracts into a single eth_call.
+
+    Queue calls with ``add`` using the bound contract method and its arguments,
+    then ``call`` returns every decoded result in the order they were added::
+
+        batch = Multicall()
+        batch.add(contract.getHostelSnapshot)
+        batch.add(contract.getStudentDetailsByAddress, student)
+        snapshot, details = batch.call()
+
+    Without a Multicall contract (see get_multicall), or with
+    ``sequential=True``, the queued calls are made one by one instead.
+    """
+
+    def __init__(self, multicall=None, sequential=False):
+        self.multicall = None if sequential else multicall or get_multicall()
+        self._calls = []
+
+    def add(self, method, *args):
+        """Queue a view call and return its position in the result list."""
+        self._calls.append((method, args))
+        return len(self._calls) - 1
+
+    def call(self):
+        """Run every queued call and return the decoded results."""
+        if not self._calls:
+            return []
+        calls, self._calls = self._calls, []
+        if self.multicall is None:
+            return [method.call(*args) for method, args in calls]
+        _, return_data = self.multicall.aggregate([(method._address, method.encode_input(*args)) for method, args in calls])
+        return [method.decode_output(data) for (method, _), data in zip(calls, return_data)]
+
+    def __len__(self):
+        return len(self._calls)
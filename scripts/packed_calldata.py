@@ -0,0 +1,37 @@
+from hexbytes import HexBytes
+
+
+def pack_string(value):
+    """A 1-byte length followed by the UTF-8 bytes, as PackedCalldata.readString expects."""
+    data = value.encode("utf-8")
+    if len(data) > 255:
+        raise ValueError(f"Packed strings are limited to 255 bytes, got {len(data)}: {value[:32]}...")
+    return bytes([len(data)]) + data
+
+
+def pack_age(age):
+    if not 0 <= age <= 255:
+        raise ValueError(f"Packed age must fit in one byte, got {age}")
+    return bytes([age])
+
+
+def encode_hostel_student(student_name, age, gender, contact, address):
+    """Payload for HostelManagement.registerStudentPacked / updateStudentDetailsPacked."""
+    return pack_age(age) + b"".join(pack_string(value) for value in (student_name, gender, contact, address))
+
+
+def encode_classroom_student(name, emailId, age, usn, department, subjects, teacherName):
+    """Payload for Classroom.registerStudentPacked / addStudentToListPacked (same argument order as addStudentToList)."""
+    if len(subjects) > 255:
+        raise ValueError("At most 255 subjects can be packed")
+    return (
+        pack_age(age)
+        + b"".join(pack_string(value) for value in (name, emailId, usn, department, teacherName))
+        + bytes([len(subjects)])
+        + b"".join(pack_string(subject) for subject in subjects)
+    )
+
+
+def calldata_size(method, *args):
+    """Bytes of calldata a contract call with these arguments sends."""
+    return len(HexBytes(method.encode_input(*args)))
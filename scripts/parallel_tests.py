@@ -0,0 +1,195 @@
+"""Run the test suite in parallel, one local chain per worker.
+
+The project is compiled once, then every test id is collected and the ids
+are sharded across workers. Each worker runs ``brownie test`` against its
+own temporary development network whose ganache instance listens on a
+dedicated port, so workers never share chain state. The networks are
+removed again when the run ends. Outcomes and timings from every worker are
+merged into one report, and the merged timings are kept to balance the
+shards on the next run.
+
+Run it directly rather than through ``brownie run``:
+
+    python scripts/parallel_tests.py --workers 4
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+TESTS_DIR = Path("tests")
+TIMINGS_PATH = Path("reports") / "test_timings.json"
+BASE_PORT = 8600
+NETWORK_PREFIX = "parallel-test"
+
+
+def compile_project():
+    """Compile once up front so workers load up-to-date artifacts instead of racing to write build/."""
+    subprocess.run(["brownie", "compile"], check=True, capture_output=True)
+
+
+def discover_tests(tests_dir=TESTS_DIR, pytest_args=()):
+    """Node ids of every test brownie would run, e.g. ``tests/test_classroom.py::test_add_student``."""
+    collected = subprocess.run(
+        ["brownie", "test", str(tests_dir), "--collect-only", "-q", *pytest_args],
+        capture_output=True, text=True, check=True,
+    )
+    return [line.strip() for line in collected.stdout.splitlines() if "::" in line]
+
+
+def shard(tests, workers, previous=None):
+    """Split test ids into ``workers`` groups of roughly equal expected runtime.
+
+    Known tests are weighted by their last measured time; unknown tests get
+    the average, and the heaviest are placed first into the lightest shard.
+    Each shard keeps its tests in collection order, so module fixtures are
+    deployed once per module per worker.
+    """
+    previous = previous or {}
+    known = [previous[test] for test in tests if test in previous]
+    default = sum(known) / len(known) if known else 1.0
+    weighted = sorted(tests, key=lambda test: previous.get(test, default), reverse=True)
+
+    shards = [[] for _ in range(min(workers, len(tests)))]
+    loads = [0.0] * len(shards)
+    for test in weighted:
+        lightest = loads.index(min(loads))
+        shards[lightest].append(test)
+        loads[lightest] += previous.get(test, default)
+    order = {test: position for position, test in enumerate(tests)}
+    return [sorted(group, key=order.get) for group in shards]
+
+
+def add_network(network_id, ganache_cmd, port):
+    """Register a temporary development network for one worker."""
+    subprocess.run(
+        [
+            "brownie", "networks", "add", "Development", network_id,
+            "host=http://127.0.0.1",
+            f"cmd={ganache_cmd}",
+            f"port={port}",
+            "chain_id=1337",
+            "accounts=10",
+            "evm_version=istanbul",
+            "mnemonic=brownie",
+        ],
+        check=True, capture_output=True,
+    )
+
+
+def remove_network(network_id):
+    subprocess.run(["brownie", "networks", "delete", network_id], capture_output=True)
+
+
+def previous_test_times():
+    if not TIMINGS_PATH.exists():
+        return {}
+    tests = json.loads(TIMINGS_PATH.read_text()).get("tests", {})
+    return {
+        nodeid: sum(value for key, value in result.items() if key != "outcome")
+        for nodeid, result in tests.items()
+    }
+
+
+def run(workers=None, ganache_cmd="ganache-cli", base_port=BASE_PORT, pytest_args=()):
+    """Run every test across ``workers`` processes and return the merged report."""
+    workers = workers or os.cpu_count() or 1
+    compile_project()
+    shards = shard(discover_tests(pytest_args=pytest_args), workers, previous_test_times())
+
+    out_dir = Path(tempfile.mkdtemp(prefix="parallel-tests-"))
+    # the pid keeps concurrent runs from clashing over network ids
+    network_ids = [f"{NETWORK_PREFIX}-{os.getpid()}-{worker}" for worker in range(len(shards))]
+    processes = []
+    start = time.perf_counter()
+    try:
+        for worker, (tests, network_id) in enumerate(zip(shards, network_ids)):
+            add_network(network_id, ganache_cmd, base_port + worker)
+            report_path = out_dir / f"worker-{worker}.json"
+            log = open(out_dir / f"worker-{worker}.log", "w")
+            env = dict(os.environ, TEST_TIMINGS_PATH=str(report_path))
+            process = subprocess.Popen(
+                ["brownie", "test", *tests, "--network", network_id, *pytest_args],
+                env=env, stdout=log, stderr=subprocess.STDOUT,
+            )
+            processes.append((worker, process, log, report_path))
+            print(f"Worker {worker} on port {base_port + worker}: {len(tests)} tests")
+
+        tests = {}
+        exit_codes = []
+        for worker, process, log, report_path in processes:
+            exit_codes.append(process.wait())
+            log.close()
+            if report_path.exists():
+                tests.update(json.loads(report_path.read_text()))
+            else:
+                print(f"Worker {worker} produced no report, see {log.name}")
+        wall_time = time.perf_counter() - start
+    finally:
+        for _, process, log, _ in processes:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            log.close()
+        for network_id in network_ids:
+            remove_network(network_id)
+
+    return merge(tests, wall_time, exit_codes, out_dir)
+
+
+def merge(tests, wall_time, exit_codes, out_dir):
+    modules = {}
+    outcomes = {}
+    for nodeid, result in tests.items():
+        module = nodeid.split("::")[0]
+        total = sum(value for key, value in result.items() if key != "outcome")
+        modules[module] = modules.get(module, 0) + total
+        outcomes[result["outcome"]] = outcomes.get(result["outcome"], 0) + 1
+    return {
+        "wall_time": wall_time,
+        "serial_time": sum(modules.values()),
+        "outcomes": outcomes,
+        "modules": modules,
+        "tests": tests,
+        "exit_codes": exit_codes,
+        "logs": str(out_dir),
+    }
+
+
+def print_report(report):
+    for nodeid, result in sorted(report["tests"].items()):
+        if result["outcome"] != "passed":
+            print(f"✗ {result['outcome'].upper()}: {nodeid}")
+    print()
+    for module, total in sorted(report["modules"].items()):
+        print(f"{total:9.3f}s  {module}")
+    summary = ", ".join(f"{count} {outcome}" for outcome, count in sorted(report["outcomes"].items()))
+    print(f"\n{summary}")
+    speedup = report["serial_time"] / report["wall_time"] if report["wall_time"] else 0
+    print(f"Wall time {report['wall_time']:.2f}s, summed test time {report['serial_time']:.2f}s ({speedup:.1f}x)")
+    print(f"Worker logs in {report['logs']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=None, help="number of workers (default: CPU count)")
+    parser.add_argument("--ganache-cmd", default="ganache-cli", help="command used to launch each local chain")
+    parser.add_argument("--base-port", type=int, default=BASE_PORT, help="port of the first worker's chain")
+    args, pytest_args = parser.parse_known_args()
+
+    report = run(args.workers, args.ganache_cmd, args.base_port, pytest_args)
+    print_report(report)
+
+    TIMINGS_PATH.parent.mkdir(exist_ok=True)
+    TIMINGS_PATH.write_text(json.dumps(report, indent=2, sort_keys=True))
+    failed = any(code not in (0, 5) for code in report["exit_codes"])
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+from brownie import chain, web3
+
+from scripts.chain_utils import decode_logs, event_decoders
+from scripts.contract_loader import contracts
+
+
+RECONCILED_EVENTS = ("RoomPaid", "PaymentsWithdrawn")
+
+
+def reconcile_payments(contract, from_block=0, to_block=None, batch_size=2000):
+    """Total RoomPaid and PaymentsWithdrawn events and check them against the contract.
+
+    Logs are fetched with one eth_getLogs call per ``batch_size`` blocks.
+    Returns a report with the totals, the per-student payments and whether
+    paid minus withdrawn matches the accrued balance the contract holds.
+    """
+    to_block = chain.height if to_block is None else to_block
+    decoders = event_decoders(contract, RECONCILED_EVENTS)
+
+    by_student = {}
+    total_paid = 0
+    total_withdrawn = 0
+    payments = 0
+    for start in range(from_block, to_block + 1, batch_size):
+        raw_logs = web3.eth.get_logs({
+            "address": contract.address,
+            "fromBlock": start,
+            "toBlock": min(start + batch_size - 1, to_block),
+            "topics": [list(decoders)],
+        })
+        for log in decode_logs(decoders, raw_logs):
+            if log.event == "RoomPaid":
+                by_student[log.args.student] = by_student.get(log.args.student, 0) + log.args.amountPaid
+                total_paid += log.args.amountPaid
+                payments += 1
+            else:
+                total_withdrawn += log.args.amount
+
+    accrued = contract.getAccruedPayments(block_identifier=to_block)
+    return {
+        "from_block": from_block,
+        "to_block": to_block,
+        "payments": payments,
+        "total_paid": total_paid,
+        "total_withdrawn": total_withdrawn,
+        "accrued": accrued,
+        "balanced": total_paid - total_withdrawn == accrued,
+        "by_student": by_student,
+    }
+
+
+def main():
+    contract = contracts.HostelManagement[-1]
+    report = reconcile_payments(contract, from_block=contract.tx.block_number if contract.tx else 0)
+    print(f"Payments: {report['payments']}")
+    print(f"Total Paid: {report['total_paid']}")
+    print(f"Total Withdrawn: {report['total_withdrawn']}")
+    print(f"Accrued On-Chain: {report['accrued']}")
+    if report["balanced"]:
+        print("✓ Ledger balances")
+    else:
+        print(f"✗ Ledger off by {report['total_paid'] - report['total_withdrawn'] - report['accrued']}")
+    return report
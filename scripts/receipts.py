@@ -0,0 +1,79 @@
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from scripts.instrumentation import operation, wait_for
+
+
+class ReceiptCollector:
+    """Resolve pending transactions in the background.
+
+    Transactions sent with ``required_confs: 0`` return immediately. ``track``
+    hands them to a worker pool that waits for confirmation, so the caller
+    gets a Future and can keep submitting independent operations.
+    """
+
+    def __init__(self, confirmations=1, max_workers=8):
+        self.confirmations = confirmations
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="receipts")
+        self._futures = []
+
+    def track(self, tx, keep=True):
+        """Return a Future that resolves to the confirmed transaction.
+
+        With ``keep=False`` the collector forgets the Future once submitted,
+        so it is not returned by ``wait_all`` and is never held past its use.
+        """
+        future = self._executor.submit(self._resolve, tx)
+        if keep:
+            self._futures.append(future)
+        return future
+
+    def _resolve(self, tx):
+        with operation(f"receipts.{tx.fn_name or 'transfer'}"):
+            wait_for(tx, self.confirmations)
+        if tx.status != 1:
+            raise ValueError(f"Transaction {tx.txid} reverted")
+        return tx
+
+    def wait_all(self):
+        """Block until every tracked transaction resolves and return the receipts in submit order."""
+        futures, self._futures = self._futures, []
+        wait(futures)
+        return [future.result() for future in futures]
+
+    def shutdown(self):
+        """Wait for outstanding receipts and stop the worker threads."""
+        self._executor.shutdown(wait=True)
+
+
+_collector = None
+
+
+def get_collector():
+    """Return the shared collector used by the non-blocking script helpers."""
+    global _collector
+    if _collector is None:
+        _collector = ReceiptCollector()
+    return _collector
+
+
+def set_collector(collector):
+    """Replace the shared collector (e.g. with one sized for a worker pool) and return the previous one."""
+    global _collector
+    previous, _collector = _collector, collector
+    return previous
+
+
+def send(method, *args, tx_params, blocking=True):
+    """Send a contract transaction.
+
+    When ``blocking`` is true the call waits for one confirmation and returns the
+    receipt, as the helpers always did. Otherwise the transaction is broadcast
+    without waiting and a Future from the shared collector is returned. The
+    collector does not keep that Future, so a long-running process does not
+    accumulate them.
+    """
+    if blocking:
+        tx = method(*args, tx_params)
+        return wait_for(tx, 1)
+    tx = method(*args, dict(tx_params, required_confs=0))
+    return get_collector().track(tx, keep=False)
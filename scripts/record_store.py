@@ -0,0 +1,92 @@
+import json
+import secrets
+import sqlite3
+
+from brownie import web3
+
+
+# Random per-record salt mixed into the hash, so a published hash cannot be
+# confirmed by hashing guessed personal details
+SALT_FIELD = "_salt"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    hash TEXT PRIMARY KEY,
+    body TEXT NOT NULL
+);
+"""
+
+
+def canonical_json(record):
+    """Serialize a record so equal records always produce the same bytes."""
+    return json.dumps(record, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def record_hash(record):
+    """The bytes32 content hash stored on-chain for a record, as 0x-prefixed hex."""
+    return "0x" + bytes(web3.keccak(text=canonical_json(record))).hex()
+
+
+def salted(record):
+    """Copy of ``record`` with a fresh 32-byte random salt under SALT_FIELD."""
+    return dict(record, **{SALT_FIELD: "0x" + secrets.token_hex(32)})
+
+
+class RecordStore:
+    """Content-addressed SQLite store for student records kept off-chain.
+
+    Each record is stored with a random salt under the keccak256 of its
+    canonical JSON, which is the value the contracts keep in ``recordHash``.
+    The details are low-entropy (names, phone numbers), so without the salt
+    anyone could confirm a guess against the on-chain hash; with it, the hash
+    reveals nothing unless the salted row is disclosed. Every read re-hashes
+    the body so a tampered row is detected rather than returned.
+    """
+
+    def __init__(self, db_path="records.db"):
+        self.db = sqlite3.connect(db_path)
+        self.db.executescript(SCHEMA)
+
+    def put(self, record):
+        """Salt and store a record and return its hash.
+
+        A record that already carries a salt (e.g. from ``get(..., include_salt=True)``)
+        is stored as is, so it keeps its hash.
+        """
+        body = record if SALT_FIELD in record else salted(record)
+        key = record_hash(body)
+        with self.db:
+            self.db.execute("INSERT OR IGNORE INTO records VALUES (?, ?)", (key, canonical_json(body)))
+        return key
+
+    def get(self, key, include_salt=False):
+        """Return the record stored under ``key``, or None if it is unknown.
+
+        The salt is dropped unless ``include_salt`` is set; it is only needed
+        to prove the record against the on-chain hash. Rows stored before
+        records were salted are returned as they are.
+        """
+        key = _normalize(key)
+        row = self.db.execute("SELECT body FROM records WHERE hash = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        record = json.loads(row[0])
+        if record_hash(record) != key:
+            raise ValueError(f"Record {key} does not match its hash")
+        if not include_salt:
+            record.pop(SALT_FIELD, None)
+        return record
+
+    def get_many(self, keys):
+        """Resolve several hashes at once; unknown hashes map to None."""
+        return {key: self.get(key) for key in keys}
+
+    def close(self):
+        self.db.close()
+
+
+def _normalize(key):
+    if isinstance(key, (bytes, bytearray)):
+        return "0x" + bytes(key).hex()
+    key = str(key).lower()
+    return key if key.startswith("0x") else "0x" + key
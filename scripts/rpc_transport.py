@@ -0,0 +1,147 @@
+import json
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import requests
+from brownie import web3
+from requests.adapters import HTTPAdapter
+from web3 import HTTPProvider
+
+
+# Calls with no side effects, safe to reorder and group into one batch.
+# Anything else (sending transactions, evm_snapshot/revert, mining) goes out
+# on its own so its ordering relative to other writes is preserved.
+BATCHABLE_METHODS = {
+    "eth_accounts",
+    "eth_blockNumber",
+    "eth_call",
+    "eth_chainId",
+    "eth_estimateGas",
+    "eth_feeHistory",
+    "eth_gasPrice",
+    "eth_getBalance",
+    "eth_getBlockByHash",
+    "eth_getBlockByNumber",
+    "eth_getCode",
+    "eth_getLogs",
+    "eth_getStorageAt",
+    "eth_getTransactionByHash",
+    "eth_getTransactionCount",
+    "eth_getTransactionReceipt",
+    "eth_maxPriorityFeePerGas",
+    "net_version",
+    "web3_clientVersion",
+}
+
+
+class BatchingHTTPProvider(HTTPProvider):
+    """HTTP provider that reuses pooled keep-alive connections and batches concurrent reads.
+
+    Read requests are queued and a dispatcher thread sends everything that
+    has queued up as one JSON-RPC batch. No timer is involved: while
+    ``max_in_flight`` batches are outstanding, new reads wait in the queue
+    and go out together in the next batch. A single sequential caller
+    therefore sees no extra latency, and concurrent callers (worker pools,
+    background receipt polling) share round trips.
+    """
+
+    def __init__(self, endpoint_uri, request_kwargs=None, max_batch_size=100, max_in_flight=4, pool_size=16):
+        super().__init__(endpoint_uri, request_kwargs=request_kwargs)
+        self.max_batch_size = max_batch_size
+        self.round_trips = 0
+        self.requests_sent = 0
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._queue = queue.Queue()
+        self._slots = threading.Semaphore(max_in_flight)
+        self._executor = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="rpc-batch")
+        self._lock = threading.Lock()
+        self._dispatcher = None
+
+    def make_request(self, method, params):
+        if method not in BATCHABLE_METHODS:
+            return self._post([self._encode(method, params)])[0]
+        future = Future()
+        self._queue.put((self._encode(method, params), future))
+        self._ensure_dispatcher()
+        return future.result()
+
+    def batch(self, calls):
+        """Send ``(method, params)`` pairs as one JSON-RPC batch and return the raw responses in order."""
+        return self._post([self._encode(method, params) for method, params in calls])
+
+    def _encode(self, method, params):
+        return json.loads(self.encode_rpc_request(method, params))
+
+    def _ensure_dispatcher(self):
+        with self._lock:
+            if self._dispatcher is None:
+                self._dispatcher = threading.Thread(target=self._dispatch, name="rpc-dispatcher", daemon=True)
+                self._dispatcher.start()
+
+    def _dispatch(self):
+        while True:
+            self._slots.acquire()
+            pending = [self._queue.get()]
+            while len(pending) < self.max_batch_size:
+                try:
+                    pending.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._executor.submit(self._send_batch, pending)
+
+    def _send_batch(self, pending):
+        try:
+            responses = self._post([payload for payload, _ in pending])
+        except Exception as e:
+            for _, future in pending:
+                future.set_exception(e)
+            return
+        finally:
+            self._slots.release()
+        for (payload, future), response in zip(pending, responses):
+            future.set_result(response)
+        for _, future in pending:
+            if not future.done():
+                future.set_exception(ValueError("No response for batched request"))
+
+    def _post(self, payloads):
+        body = payloads[0] if len(payloads) == 1 else payloads
+        # headers, proxies, verify, timeout... as configured on the provider
+        request_kwargs = dict(self.get_request_kwargs())
+        request_kwargs.setdefault("timeout", 30)
+        response = self._session.post(self.endpoint_uri, data=json.dumps(body), **request_kwargs)
+        response.raise_for_status()
+        decoded = response.json()
+        with self._lock:
+            self.round_trips += 1
+            self.requests_sent += len(payloads)
+        if not isinstance(decoded, list):
+            if len(payloads) == 1:
+                return [decoded]
+            # a node that rejects the whole batch answers with one error object
+            error = decoded.get("error") or {"code": -32603, "message": "Unexpected batch response"}
+            return [{"jsonrpc": "2.0", "id": payload["id"], "error": error} for payload in payloads]
+        # batch responses may come back in any order
+        by_id = {item.get("id"): item for item in decoded}
+        return [
+            by_id.get(payload["id"], {"jsonrpc": "2.0", "id": payload["id"], "error": {"code": -32603, "message": "Missing response in batch"}})
+            for payload in payloads
+        ]
+
+
+def install_transport(**kwargs):
+    """Route brownie's web3 traffic through a BatchingHTTPProvider on the same endpoint.
+
+    Non-HTTP providers (IPC, websockets) are left alone. Returns the active provider.
+    """
+    provider = web3.provider
+    endpoint = str(getattr(provider, "endpoint_uri", ""))
+    if isinstance(provider, BatchingHTTPProvider) or not endpoint.startswith("http"):
+        return provider
+    request_kwargs = getattr(provider, "_request_kwargs", None) or {"timeout": 30}
+    web3.provider = BatchingHTTPProvider(endpoint, request_kwargs=request_kwargs, **kwargs)
+    return web3.provider
@@ -0,0 +1,99 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from brownie import chain, web3
+from brownie.convert import to_address
+from hexbytes import HexBytes
+
+from scripts.chain_utils import chain_key, to_hex
+
+
+class TransactionScanner:
+    """Find every transaction sent to an address across a block range.
+
+    The range is split into chunks of ``chunk_size`` blocks that a pool of
+    ``workers`` threads fetch with full transaction bodies, one request per
+    block instead of one per transaction. Matches and the highest block
+    scanned without gaps are kept in a JSON checkpoint, keyed by the chain
+    (see chain_utils.chain_key) and the address, so a later scan on the
+    same chain only walks the blocks it has not seen yet.
+    """
+
+    def __init__(self, address, checkpoint_path="scanner_checkpoint.json", chunk_size=100, workers=8):
+        self.address = to_address(str(address))
+        self.key = f"{chain_key()}:{self.address}"
+        self.checkpoint_path = Path(checkpoint_path)
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.first_block, self.last_block, self.matches = self._load_checkpoint()
+
+    def _load_checkpoint(self):
+        if not self.checkpoint_path.exists():
+            return None, -1, []
+        state = json.loads(self.checkpoint_path.read_text()).get(self.key)
+        if state is None:
+            return None, -1, []
+        return state.get("first_block", 0), state["last_block"], state["matches"]
+
+    def _save_checkpoint(self):
+        state = json.loads(self.checkpoint_path.read_text()) if self.checkpoint_path.exists() else {}
+        state[self.key] = {"first_block": self.first_block, "last_block": self.last_block, "matches": self.matches}
+        self.checkpoint_path.write_text(json.dumps(state, indent=2))
+
+    def scan(self, from_block=0, to_block=None):
+        """Return every match between ``from_block`` and ``to_block`` (default: chain head).
+
+        Blocks covered by the checkpoint are served from it, and the first
+        scan for a chain and address starts the checkpoint at ``from_block``.
+        A range that starts outside the checkpoint would leave a gap, so it
+        is scanned without being recorded. The checkpoint is written once,
+        when the scan finishes or fails.
+        """
+        to_block = chain.height if to_block is None else to_block
+        if self.first_block is None:
+            self.first_block, self.last_block = from_block, from_block - 1
+        contiguous = self.first_block <= from_block <= self.last_block + 1
+        start = self.last_block + 1 if contiguous else from_block
+        chunks = [
+            (chunk_start, min(chunk_start + self.chunk_size - 1, to_block))
+            for chunk_start in range(start, to_block + 1, self.chunk_size)
+        ]
+
+        found = []
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                # map yields in submission order, so the checkpoint only ever
+                # advances over a contiguous prefix of finished chunks
+                for (_, chunk_end), chunk_matches in zip(chunks, executor.map(self._scan_chunk, chunks)):
+                    if contiguous:
+                        self.matches.extend(chunk_matches)
+                        self.last_block = chunk_end
+                    else:
+                        found.extend(chunk_matches)
+        finally:
+            if contiguous:
+                self._save_checkpoint()
+        matches = self.matches if contiguous else found
+        return [match for match in matches if from_block <= match["block"] <= to_block]
+
+    def _scan_chunk(self, chunk):
+        chunk_start, chunk_end = chunk
+        found = []
+        for number in range(chunk_start, chunk_end + 1):
+            block = web3.eth.get_block(number, full_transactions=True)
+            for tx in block.transactions:
+                if tx.to == self.address:
+                    found.append({
+                        "hash": to_hex(tx.hash),
+                        "block": number,
+                        "from": tx["from"],
+                        "selector": to_hex(HexBytes(tx.input)[:4]),
+                        "value": tx.value,
+                    })
+        return found
+
+
+def scan_contract_transactions(address, from_block=0, to_block=None, **kwargs):
+    """Return every transaction sent to ``address`` between the two blocks."""
+    return TransactionScanner(address, **kwargs).scan(from_block, to_block)
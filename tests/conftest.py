@@ -0,0 +1,107 @@
+import json
+import os
+
+import pytest
+from brownie import Classroom, HostelManagement, SimpleStorage, accounts
+
+
+# ============ Shared Fixtures ============
+#
+# Each contract is deployed once per test module. Every test then runs
+# between a chain snapshot and revert (fn_isolation), so it still starts
+# from the freshly deployed state without paying for a new deployment.
+
+
+@pytest.fixture(scope="module", autouse=True)
+def module_setup(module_isolation):
+    """Revert everything a module deployed once the module finishes."""
+    pass
+
+
+@pytest.fixture(autouse=True)
+def isolation(fn_isolation):
+    """Snapshot the chain before each test and revert it afterwards."""
+    pass
+
+
+@pytest.fixture(scope="module")
+def account():
+    """Provide the first account for testing."""
+    return accounts[0]
+
+
+@pytest.fixture(scope="module")
+def hostel_contract(account):
+    """Deploy HostelManagement once for the module."""
+    return HostelManagement.deploy(
+        "University of Lagos",  # schoolName
+        "Moremi Hall",          # hostelName
+        "UNILAG Campus",        # location
+        "Mr. Johnson",          # hostelManager
+        100,                    # totalRooms
+        50000,                  # roomPricePerMonth (in wei or smallest unit)
+        {"from": account}
+    )
+
+
+@pytest.fixture(scope="module")
+def classroom_contract(account):
+    """Deploy Classroom once for the module."""
+    return Classroom.deploy({"from": account})
+
+
+@pytest.fixture(scope="module")
+def simple_storage(account):
+    """Deploy SimpleStorage once for the module."""
+    return SimpleStorage.deploy({"from": account})
+
+
+# ============ Timing Report ============
+
+_timings = {}
+_outcomes = {}
+
+
+def pytest_runtest_logreport(report):
+    _timings.setdefault(report.nodeid, {})[report.when] = report.duration
+    if report.failed and report.when != "call":
+        _outcomes[report.nodeid] = "error"
+    elif report.when == "call" or report.skipped:
+        _outcomes.setdefault(report.nodeid, report.outcome)
+
+
+def pytest_sessionfinish(session):
+    """Dump outcomes and timings as JSON when TEST_TIMINGS_PATH is set (used by scripts/parallel_tests.py)."""
+    path = os.environ.get("TEST_TIMINGS_PATH")
+    if path:
+        report = {
+            nodeid: dict(phases, outcome=_outcomes.get(nodeid, "passed"))
+            for nodeid, phases in _timings.items()
+        }
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Print setup/call/teardown time for every test and a total per module.
+
+    The first test in a module carries that module's deployment in its
+    setup column; every later test should only show snapshot overhead.
+    """
+    if not _timings:
+        return
+    write = terminalreporter.write_line
+    terminalreporter.section("test timings")
+    write(f"{'setup':>9} {'call':>9} {'teardown':>9} {'total':>9}  test")
+    modules = {}
+    for nodeid, phases in sorted(_timings.items(), key=lambda item: -sum(item[1].values())):
+        total = sum(phases.values())
+        modules[nodeid.split("::")[0]] = modules.get(nodeid.split("::")[0], 0) + total
+        write(
+            f"{phases.get('setup', 0):9.3f} {phases.get('call', 0):9.3f} "
+            f"{phases.get('teardown', 0):9.3f} {total:9.3f}  {nodeid}"
+        )
+    write("")
+    for module, total in sorted(modules.items()):
+        write(f"{total:9.3f}s  {module}")
+    write(f"{sum(modules.values()):9.3f}s  total")
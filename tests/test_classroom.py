@@ -1,14 +1,9 @@
 from brownie import Classroom, accounts, network
+from scripts.classroom_deploy import SubjectTable
+from scripts.packed_calldata import calldata_size, encode_classroom_student
+from scripts.record_store import RecordStore
 import pytest
 
-@pytest.fixture
-def classroom_contract():
-    """Deploy a fresh Classroom contract for each test."""
-    account = accounts[0]
-    contract = Classroom.deploy({'from': account})
-    return contract
-
-
 # ============ Student Tests ============
 
 def test_register_student(classroom_contract):
@@ -98,6 +93,35 @@ def test_add_student_to_list(classroom_contract):
     assert contract.getStudentCount() == 2
 
 
+def test_add_students_batch(classroom_contract):
+    """Test adding several students in one transaction."""
+    contract = classroom_contract
+    contract.addStudentsBatch(
+        ["Student1", "Student2", "Student3"],
+        ["s1@email.com", "s2@email.com", "s3@email.com"],
+        [20, 21, 22],
+        ["USN001", "USN002", "USN003"],
+        ["CS", "CS", "EE"],
+        [["Math"], ["Physics"], ["Math", "Circuits"]],
+        ["Prof. Smith", "Prof. Smith", "Prof. Lee"],
+        {'from': accounts[0]}
+    )
+    assert contract.getStudentCount() == 3
+    result = contract.checkStudentSuspensionByUSN("USN003")
+    assert result[0] == False
+
+
+def test_add_students_batch_length_mismatch(classroom_contract):
+    """Test that batch arrays of different lengths are rejected."""
+    contract = classroom_contract
+    with pytest.raises(Exception):
+        contract.addStudentsBatch(
+            ["Student1", "Student2"], ["s1@email.com"], [20, 21],
+            ["USN001", "USN002"], ["CS", "CS"], [["Math"], ["Physics"]],
+            ["Prof. Smith", "Prof. Smith"], {'from': accounts[0]}
+        )
+
+
 def test_clear_student_list(classroom_contract):
     """Test clearing student list."""
     contract = classroom_contract
@@ -171,6 +195,126 @@ def test_check_student_in_list_by_usn(classroom_contract):
     assert result[0] == False  # not suspended
 
 
+def test_check_student_in_large_list_by_usn(classroom_contract):
+    """Test that indexed lookups find students anywhere in the list."""
+    contract = classroom_contract
+    count = 20
+    contract.addStudentsBatch(
+        [f"Student{i}" for i in range(count)],
+        [f"s{i}@email.com" for i in range(count)],
+        [20] * count,
+        [f"USN{i:03d}" for i in range(count)],
+        ["CS"] * count,
+        [["Math"]] * count,
+        ["Prof. Smith"] * count,
+        {'from': accounts[0]}
+    )
+    assert contract.checkStudentSuspensionByUSN("USN019")[0] == False
+    assert contract.checkStudentSuspensionByName("Student7")[0] == False
+    with pytest.raises(Exception):
+        contract.checkStudentSuspensionByUSN("USN999")
+
+
+def test_student_lookup_after_clearing_list(classroom_contract):
+    """Test that index entries from a cleared list are not reused."""
+    contract = classroom_contract
+    contract.addStudentToList(
+        "Charlie", "charlie@email.com", 22, "USN003", "CS",
+        ["Math"], "Prof. Smith", {'from': accounts[0]}
+    )
+    contract.clearStudentList({'from': accounts[0]})
+    with pytest.raises(Exception):
+        contract.checkStudentSuspensionByName("Charlie")
+
+    contract.addStudentToList(
+        "David", "david@email.com", 23, "USN004", "CS",
+        ["Physics"], "Prof. Johnson", {'from': accounts[0]}
+    )
+    with pytest.raises(Exception):
+        contract.checkStudentSuspensionByName("Charlie")
+    contract.addStudentToList(
+        "Charlie", "charlie@email.com", 22, "USN003", "CS",
+        ["Math"], "Prof. Smith", {'from': accounts[0]}
+    )
+    assert contract.checkStudentSuspensionByUSN("USN003")[0] == False
+
+
+def test_clearing_list_reuses_slots_and_resets_department_members(classroom_contract):
+    """Test that a cleared list overwrites old slots and drops department members from before the clear."""
+    contract = classroom_contract
+    for i in range(3):
+        contract.addStudentToList(
+            f"Student{i}", f"s{i}@email.com", 20, f"USN00{i}", "CS",
+            ["Math"], "Prof. Smith", {'from': accounts[0]}
+        )
+    contract.registerDepartment("CS", "Dr. Ada", 200, 20, ["Math"], [0, 1, 2], [], {'from': accounts[0]})
+    contract.clearStudentList({'from': accounts[0]})
+    assert contract.getStudentCount() == 0
+    assert contract.getDepartmentMembers(0, 10) == []
+    with pytest.raises(Exception):
+        contract.addStudentToDepartment(0, {'from': accounts[0]})
+    with pytest.raises(Exception):
+        contract.students(0)
+
+    contract.addStudentToList(
+        "Newcomer", "new@email.com", 19, "USN100", "EE",
+        ["Physics"], "Prof. Lee", {'from': accounts[0]}
+    )
+    assert contract.getStudentCount() == 1
+    assert contract.students(0)[0] == "Newcomer"
+    with pytest.raises(Exception):
+        contract.students(1)
+    assert contract.checkStudentSuspensionByUSN("USN100")[0] == False
+    with pytest.raises(Exception):
+        contract.checkStudentSuspensionByUSN("USN001")
+    contract.addStudentToDepartment(0, {'from': accounts[0]})
+    assert contract.getDepartmentMembers(0, 10) == [0]
+
+    contract.addTeacherToList("Prof. Smith", "smith@email.com", 45, "CS", ["Math"], {'from': accounts[0]})
+    assert contract.teachers(0)[0] == "Prof. Smith"
+    contract.clearTeacherList({'from': accounts[0]})
+    with pytest.raises(Exception):
+        contract.teachers(0)
+
+
+def test_add_student_record_to_list(classroom_contract, tmp_path):
+    """Test adding a student whose email, department and teacher name are kept off-chain."""
+    contract = classroom_contract
+    store = RecordStore(str(tmp_path / "records.db"))
+    record = {"emailId": "eve@email.com", "department": "CS", "teacherName": "Prof. Smith"}
+    contract.addStudentRecordToList("Eve", 21, "USN050", ["Math"], store.put(record), {'from': accounts[0]})
+
+    assert contract.getStudentCount() == 1
+    assert contract.checkStudentSuspensionByUSN("USN050")[0] == False
+    assert contract.students(0)[1] == ""
+    assert store.get(contract.getStudentRecordHash(0)) == record
+    with pytest.raises(Exception):
+        contract.addStudentRecordToList("Eve", 21, "USN051", ["Math"], "0x" + "00" * 32, {'from': accounts[0]})
+    store.close()
+
+
+def test_add_student_to_list_packed(classroom_contract):
+    """Test that a packed payload adds the same student with less calldata than addStudentToList."""
+    contract = classroom_contract
+    args = ("Frank", "frank@email.com", 22, "USN060", "CS", ["Math", "Physics"], "Prof. Smith")
+    payload = encode_classroom_student(*args)
+    contract.addStudentToListPacked(payload, {'from': accounts[0]})
+
+    listed = contract.students(0)
+    assert listed[0] == "Frank"
+    assert listed[1] == "frank@email.com"
+    assert listed[3] == "USN060"
+    assert contract.checkStudentSuspensionByName("Frank")[0] == False
+    assert calldata_size(contract.addStudentToListPacked, payload) < calldata_size(contract.addStudentToList, *args)
+
+    contract.registerStudentPacked(payload, {'from': accounts[0]})
+    assert contract.getStudentSubjects() == ["Math", "Physics"]
+    with pytest.raises(Exception):
+        contract.addStudentToListPacked(payload + b"\x00", {'from': accounts[0]})
+    with pytest.raises(Exception, match="Malformed payload"):
+        contract.addStudentToListPacked(b"", {'from': accounts[0]})
+
+
 # ============ Teacher Tests ============
 
 def test_register_teacher(classroom_contract):
@@ -312,8 +456,7 @@ def test_update_department_details(classroom_contract):
         ["Math"], [], [], {'from': accounts[0]}
     )
     contract.updateDepartmentDetails(
-        "Computer Engineering", "Dr. Alan", 250, 25,
-        [], [], {'from': accounts[0]}
+        "Computer Engineering", "Dr. Alan", 250, 25, {'from': accounts[0]}
     )
     updated_details = contract.getDepartmentDetails()
     assert updated_details[0] == "Computer Engineering"
@@ -322,6 +465,39 @@ def test_update_department_details(classroom_contract):
     assert updated_details[3] == 25
 
 
+def test_department_membership(classroom_contract):
+    """Test adding, removing and paging department members by ID."""
+    contract = classroom_contract
+    for i in range(4):
+        contract.addStudentToList(
+            f"Student{i}", f"s{i}@email.com", 20, f"USN00{i}", "CS",
+            ["Math"], "Prof. Smith", {'from': accounts[0]}
+        )
+    contract.addTeacherToList("Teacher1", "t1@email.com", 35, "CS", ["Math"], {'from': accounts[0]})
+    contract.registerDepartment(
+        "CS", "Dr. Ada", 200, 20, ["Math"], [0, 1], [0], {'from': accounts[0]}
+    )
+    contract.addStudentToDepartment(2, {'from': accounts[0]})
+    contract.addStudentToDepartment(3, {'from': accounts[0]})
+
+    details = contract.getDepartmentDetails()
+    assert details[4] == 4
+    assert details[5] == 1
+    assert contract.getDepartmentMembers(0, 10) == [0, 1, 2, 3]
+    assert contract.getDepartmentMembers(1, 2) == [1, 2]
+    assert contract.getDepartmentMembers(10, 2) == []
+    assert contract.getDepartmentTeachers(0, 10) == [0]
+
+    contract.removeStudentFromDepartment(1, {'from': accounts[0]})
+    assert contract.getDepartmentMembers(0, 10) == [0, 3, 2]
+    with pytest.raises(Exception):
+        contract.removeStudentFromDepartment(1, {'from': accounts[0]})
+    with pytest.raises(Exception):
+        contract.addStudentToDepartment(0, {'from': accounts[0]})
+    with pytest.raises(Exception):
+        contract.addStudentToDepartment(99, {'from': accounts[0]})
+
+
 def test_deactivate_department(classroom_contract):
     """Test deactivating a department."""
     contract = classroom_contract
@@ -357,3 +533,35 @@ def test_get_department_count(classroom_contract):
 
 
 
+
+
+def test_subjects_share_interned_ids(classroom_contract):
+    """Test that repeated subject names reuse one table entry and decode from the mask."""
+    contract = classroom_contract
+    contract.registerStudent(
+        "Banx", "banx@gmail.com", 20, "USN001", "CS",
+        ["Math", "Physics"], "Prof. Smith", {'from': accounts[0]}
+    )
+    contract.registerTeacher("Prof. Smith", "smith@email.com", 40, "CS", ["Physics", "Chemistry"], {'from': accounts[0]})
+    assert contract.getSubjectCount() == 3
+    assert contract.getSubjectNames(0, 10) == ["Math", "Physics", "Chemistry"]
+    assert contract.getStudentSubjectMask() == 0b011
+    assert contract.getTeacherSubjectMask() == 0b110
+
+    table = SubjectTable(contract)
+    assert table.decode(0b101) == ["Math", "Chemistry"]
+    assert table.encode(["Chemistry", "Math"]) == 0b101
+    assert contract.getTeacherSubjects() == ["Physics", "Chemistry"]
+
+
+def test_only_owner_adds_new_subjects(classroom_contract):
+    """Test that other accounts can use registered subjects but cannot add new ones."""
+    contract = classroom_contract
+    contract.registerSubject("Math", {'from': accounts[0]})
+    with pytest.raises(Exception):
+        contract.registerSubject("Art", {'from': accounts[1]})
+    with pytest.raises(Exception):
+        contract.addStudentToList("Eve", "eve@email.com", 21, "USN070", "CS", ["Art"], "Prof. Smith", {'from': accounts[1]})
+
+    contract.addStudentToList("Eve", "eve@email.com", 21, "USN070", "CS", ["Math"], "Prof. Smith", {'from': accounts[1]})
+    assert contract.getSubjectCount() == 1
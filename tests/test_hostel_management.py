@@ -1,27 +1,14 @@
-from brownie import HostelManagement, accounts
+from brownie import HostelManagement, HostelManagementUnpacked, HostelRegistry, Multicall, accounts
 import pytest
 
-
-@pytest.fixture
-def hostel_contract():
-    """Deploy a fresh HostelManagement contract for each test."""
-    account = accounts[0]
-    contract = HostelManagement.deploy(
-        "University of Lagos",  # schoolName
-        "Moremi Hall",          # hostelName
-        "UNILAG Campus",        # location
-        "Mr. Johnson",          # hostelManager
-        100,                    # totalRooms
-        50000,                  # roomPricePerMonth (in wei or smallest unit)
-        {"from": account}
-    )
-    return contract
-
-
-@pytest.fixture
-def account():
-    """Provide the first account for testing."""
-    return accounts[0]
+from scripts.event_exporter import EventExporter
+from scripts.hostel_indexer import HostelIndexer
+from scripts.hostel_management_deploy import get_room_map, store_in_database
+from scripts.instrumentation import summarize
+from scripts.multicall import Multicall as MulticallBatch, deploy_multicall, get_multicall
+from scripts.packed_calldata import calldata_size, encode_hostel_student
+from scripts.payment_reconciliation import reconcile_payments
+from scripts.record_store import RecordStore, canonical_json, record_hash as hash_record
 
 
 def test_student_registration(hostel_contract, account):
@@ -87,6 +74,22 @@ def test_vacate_room(hostel_contract, account):
     assert hostel_contract.occupiedRooms() == 0
     assert hostel_contract.availableRooms() == 100
     assert hostel_contract.isRoomBooked() == False
+    assert hostel_contract.registeredStudents() == 0
+    assert hostel_contract.isResident(account) == False
+
+
+def test_vacated_student_can_register_again(hostel_contract, account):
+    """Test that a student who vacated can register again and gets a room back."""
+    hostel_contract.registerStudent("John Doe", 22, "Male", "08012345678", "456 Oak Ave", {"from": account})
+    hostel_contract.vacateRoom({"from": account})
+
+    hostel_contract.registerStudent("John Doe", 23, "Male", "08012345678", "12 Elm St", {"from": account})
+    _, room_no, registered, has_room, suspended, _ = hostel_contract.getStudentAccount(account)
+    assert (registered, has_room, suspended) == (True, True, False)
+    assert room_no == 1
+    assert hostel_contract.registeredStudents() == 1
+    assert hostel_contract.occupiedRooms() == 1
+    assert hostel_contract.getStudentDetailsByAddress(account)[1] == 23
 
 
 def test_update_student_details(hostel_contract, account):
@@ -159,3 +162,326 @@ def test_room_status(hostel_contract, account):
     # Check occupied status
     assert hostel_contract.getRoomStatus() == "Occupied"
 
+
+
+def test_multiple_students_registration(hostel_contract):
+    """Test that each address keeps its own student record."""
+    hostel_contract.registerStudent("Ada", 19, "Female", "08011111111", "12 Marina Rd", {"from": accounts[1]})
+    hostel_contract.registerStudent("Tunde", 22, "Male", "08022222222", "7 Allen Ave", {"from": accounts[2]})
+
+    assert hostel_contract.getStudentDetailsByAddress(accounts[1])[0] == "Ada"
+    assert hostel_contract.getStudentDetailsByAddress(accounts[2])[0] == "Tunde"
+    assert hostel_contract.registeredStudents() == 2
+    assert hostel_contract.occupiedRooms() == 2
+    assert hostel_contract.availableRooms() == 98
+
+
+def test_duplicate_registration_rejected(hostel_contract, account):
+    """Test that an address cannot register twice."""
+    hostel_contract.registerStudent("Banx", 20, "Male", "09012345678", "123 Main St", {"from": account})
+    with pytest.raises(Exception):
+        hostel_contract.registerStudent("Banx", 20, "Male", "09012345678", "123 Main St", {"from": account})
+
+
+def test_suspend_student(hostel_contract, account):
+    """Test suspending one student leaves the other residents untouched."""
+    hostel_contract.registerStudent("Ada", 19, "Female", "08011111111", "12 Marina Rd", {"from": accounts[1]})
+    hostel_contract.registerStudent("Tunde", 22, "Male", "08022222222", "7 Allen Ave", {"from": accounts[2]})
+
+    hostel_contract.suspendStudent(accounts[1], "Violation of hostel rules", {"from": account})
+
+    assert hostel_contract.getStudentDetailsByAddress(accounts[1])[0] == ""
+    assert hostel_contract.getStudentDetailsByAddress(accounts[2])[0] == "Tunde"
+    assert hostel_contract.isResident(accounts[1]) == False
+    assert hostel_contract.registeredStudents() == 1
+    assert hostel_contract.occupiedRooms() == 1
+    assert hostel_contract.getRoomStatus() == "Occupied"
+
+
+
+def test_only_hostel_wallet_can_suspend(hostel_contract, account):
+    """Test that a resident cannot suspend another resident."""
+    hostel_contract.registerStudent("Ada", 19, "Female", "08011111111", "12 Marina Rd", {"from": accounts[1]})
+    hostel_contract.registerStudent("Tunde", 22, "Male", "08022222222", "7 Allen Ave", {"from": accounts[2]})
+
+    with pytest.raises(Exception):
+        hostel_contract.suspendStudent(accounts[1], "Violation of hostel rules", {"from": accounts[2]})
+    assert hostel_contract.isResident(accounts[1]) == True
+
+def test_hostel_snapshot(hostel_contract, account):
+    """Test that the snapshot view reports the same state as the individual getters."""
+    hostel_contract.registerStudent("Banx", 20, "Male", "09012345678", "123 Main St", {"from": account})
+
+    snapshot = hostel_contract.getHostelSnapshot()
+    assert snapshot[0] == "University of Lagos"
+    assert snapshot[1] == "Moremi Hall"
+    assert snapshot[4] == 100
+    assert snapshot[5] == hostel_contract.occupiedRooms() == 1
+    assert snapshot[6] == hostel_contract.availableRooms() == 99
+    assert snapshot[7] == 50000
+    assert snapshot[8] == hostel_contract.getRoomStatus() == "Occupied"
+    assert snapshot[9] == 1
+
+
+def test_multicall_aggregates_reads(hostel_contract, account):
+    """Test that Multicall returns each call's decoded result in one eth_call."""
+    hostel_contract.registerStudent("Banx", 20, "Male", "09012345678", "123 Main St", {"from": account})
+    multicall = Multicall.deploy({"from": account})
+
+    calls = [
+        (hostel_contract.address, hostel_contract.availableRooms.encode_input()),
+        (hostel_contract.address, hostel_contract.getStudentDetailsByAddress.encode_input(account)),
+    ]
+    _, results = multicall.aggregate(calls)
+
+    assert hostel_contract.availableRooms.decode_output(results[0]) == 99
+    assert hostel_contract.getStudentDetailsByAddress.decode_output(results[1])[0] == "Banx"
+
+
+def test_multicall_wrapper_matches_sequential_calls(hostel_contract, account):
+    """Test that the Multicall wrapper decodes results in order, with and without a Multicall contract."""
+    hostel_contract.registerStudent("Banx", 20, "Male", "09012345678", "123 Main St", {"from": account})
+    multicall = deploy_multicall(account)
+    assert multicall is not None
+    assert get_multicall() == multicall
+    assert deploy_multicall(account) == multicall
+
+    results = []
+    for batch in (MulticallBatch(multicall), MulticallBatch(sequential=True)):
+        assert batch.add(hostel_contract.availableRooms) == 0
+        assert batch.add(hostel_contract.getStudentDetailsByAddress, account) == 1
+        assert len(batch) == 2
+        results.append(batch.call())
+        assert len(batch) == 0
+    assert results[0] == results[1]
+    assert results[0][0] == 99
+    assert results[0][1][0] == "Banx"
+
+def test_indexer_tracks_events(hostel_contract, account, tmp_path):
+    """Test that the event indexer rebuilds occupancy, payments and suspensions and resumes from its checkpoint."""
+    hostel_contract.registerStudent("Ada", 19, "Female", "08011111111", "12 Marina Rd", {"from": accounts[1]})
+    hostel_contract.registerStudent("Tunde", 22, "Male", "08022222222", "7 Allen Ave", {"from": accounts[2]})
+    hostel_contract.makePayment({"from": accounts[1], "value": 50000})
+
+    indexer = HostelIndexer(hostel_contract, db_path=str(tmp_path / "index.db"))
+    indexer.sync()
+    assert indexer.occupied_rooms() == 2
+    assert indexer.total_paid(accounts[1]) == 50000
+    assert indexer.get_student(accounts[2])["name"] == "Tunde"
+
+    hostel_contract.suspendStudent(accounts[2], "Violation of hostel rules", {"from": account})
+    assert indexer.sync() == 2  # RoomVacated + StudentSuspended
+    assert indexer.occupied_rooms() == 1
+    assert indexer.get_residents() == [accounts[1].address]
+    assert indexer.get_student(accounts[2])["suspension_reason"] == "Violation of hostel rules"
+    assert indexer.sync() == 0
+
+    hostel_contract.bookRooms(2, {"from": account})
+    hostel_contract.registerStudent("", 20, "Male", "080", "Campus", {"from": accounts[3]})
+    assert indexer.sync() == 2
+    assert indexer.occupied_rooms() == hostel_contract.occupiedRooms() == 4
+    assert indexer.get_student(accounts[3])["has_room"] == 1
+
+
+def test_student_account_flags(hostel_contract, account):
+    """Test that the packed student account tracks registration, room and payment state."""
+    hostel_contract.registerStudent("Banx", 20, "Male", "09012345678", "123 Main St", {"from": account})
+    hostel_contract.makePayment({"from": account, "value": 60000})
+
+    balance, _, registered, has_room, suspended, paid = hostel_contract.getStudentAccount(account)
+    assert balance == 60000
+    assert registered == True
+    assert has_room == True
+    assert suspended == False
+    assert paid == True
+
+    hostel_contract.suspendStudent(account, "Violation of hostel rules", {"from": account})
+    balance, _, registered, has_room, suspended, _ = hostel_contract.getStudentAccount(account)
+    assert balance == 60000
+    assert (registered, has_room, suspended) == (False, False, True)
+
+
+def test_packed_layout_gas_comparison(hostel_contract):
+    """Compare registration and payment gas against the original unpacked storage layout."""
+    unpacked = HostelManagementUnpacked.deploy(100, 50000, {"from": accounts[0]})
+    details = ("Banx", 20, "Male", "09012345678", "123 Main St, City")
+
+    packed_register = hostel_contract.registerStudent(*details, {"from": accounts[1]})
+    unpacked_register = unpacked.registerStudent(*details, {"from": accounts[1]})
+    packed_payment = hostel_contract.makePayment({"from": accounts[1], "value": 50000})
+    unpacked_payment = unpacked.makePayment({"from": accounts[1], "value": 50000})
+
+    print(f"registerStudent gas: packed {packed_register.gas_used}, unpacked {unpacked_register.gas_used}")
+    print(f"makePayment gas: packed {packed_payment.gas_used}, unpacked {unpacked_payment.gas_used}")
+    assert packed_register.gas_used < unpacked_register.gas_used
+    assert packed_payment.gas_used < unpacked_payment.gas_used
+
+
+def test_registry_creates_initialized_clones(hostel_contract, account):
+    """Test that the registry creates independent, initialized hostel clones."""
+    registry = HostelRegistry.deploy(hostel_contract.address, {"from": account})
+    tx = registry.createHostels([
+        ("University of Lagos", "Jaja Hall", "UNILAG Campus", "Mrs. Ade", 50, 40000),
+        ("University of Lagos", "Eni Njoku Hall", "UNILAG Campus", "Mr. Obi", 80, 45000),
+    ], {"from": account})
+
+    assert registry.getHostelCount() == 2
+    jaja = HostelManagement.at(tx.events["HostelCreated"][0]["hostel"])
+    eni_njoku = HostelManagement.at(tx.events["HostelCreated"][1]["hostel"])
+    assert jaja.hostelName() == "Jaja Hall"
+    assert jaja.availableRooms() == 50
+    assert eni_njoku.roomPricePerMonth() == 45000
+    assert jaja.getHostelWallet() == account
+
+    jaja.registerStudent("Banx", 20, "Male", "09012345678", "123 Main St", {"from": account})
+    assert jaja.occupiedRooms() == 1
+    assert eni_njoku.occupiedRooms() == 0
+    assert hostel_contract.occupiedRooms() == 0
+
+
+def test_hostel_cannot_be_initialized_twice(hostel_contract, account):
+    """Test that deployed hostels and registry clones reject a second initialize."""
+    with pytest.raises(Exception):
+        hostel_contract.initialize("School", "Hall", "Campus", "Manager", 10, 100, {"from": account})
+
+    registry = HostelRegistry.deploy(hostel_contract.address, {"from": account})
+    tx = registry.createHostel("School", "Hall", "Campus", "Manager", 10, 100, {"from": account})
+    clone = HostelManagement.at(tx.events["HostelCreated"]["hostel"])
+    with pytest.raises(Exception):
+        clone.initialize("School", "Hall", "Campus", "Manager", 10, 100, {"from": account})
+    with pytest.raises(Exception):
+        registry.createHostel("School", "Hall", "Campus", "Manager", 10, 100, {"from": accounts[1]})
+
+
+def test_rooms_allocated_lowest_free_first(hostel_contract):
+    """Test that residents get the lowest free room and vacated rooms are reused."""
+    for i in range(1, 4):
+        hostel_contract.registerStudent(f"Student{i}", 20, "Male", "0800000000", "Campus", {"from": accounts[i]})
+    assert [hostel_contract.getStudentAccount(accounts[i])[1] for i in range(1, 4)] == [1, 2, 3]
+
+    hostel_contract.vacateRoom({"from": accounts[2]})
+    assert hostel_contract.getStudentAccount(accounts[2])[1] == 0
+    assert hostel_contract.isRoomOccupied(2) == False
+
+    hostel_contract.registerStudent("Student4", 20, "Male", "0800000000", "Campus", {"from": accounts[4]})
+    assert hostel_contract.getStudentAccount(accounts[4])[1] == 2
+    assert hostel_contract.getOccupancyBitmap(0, 1) == [0b111]
+
+
+def test_room_allocation_crosses_bitmap_words(account):
+    """Test allocation and the room map in a hall larger than one bitmap word."""
+    contract = HostelManagement.deploy("School", "Big Hall", "Campus", "Manager", 1000, 50000, {"from": account})
+    contract.bookRooms(256, {"from": account})
+    contract.registerStudent("Banx", 20, "Male", "0800000000", "Campus", {"from": accounts[1]})
+
+    assert contract.getStudentAccount(accounts[1])[1] == 257
+    words = contract.getOccupancyBitmap(0, 4)
+    assert words[0] == 2**256 - 1
+    assert words[1] == 1
+    assert words[2] == words[3] == 0
+    assert get_room_map(contract).count(True) == 257
+
+
+def test_instrumented_helpers_count_rpc_requests(hostel_contract, account):
+    """Test that instrumented helpers record their JSON-RPC requests and gas on the default provider."""
+    name = "hostel_management_deploy.store_in_database"
+    before = summarize().get(name, {"calls": 0, "rpc_calls": 0, "gas_used": 0})
+    hostel_contract.registerStudent("Banx", 20, "Male", "09012345678", "123 Main St", {"from": account})
+    tx = store_in_database(hostel_contract, account)
+
+    after = summarize()[name]
+    assert after["calls"] == before["calls"] + 1
+    assert after["rpc_calls"] > before["rpc_calls"]
+    assert after["gas_used"] == before["gas_used"] + tx.gas_used
+
+
+def test_payments_accrue_until_withdrawn(hostel_contract, account):
+    """Test that rent accrues in the contract and the hostel wallet withdraws it in one call."""
+    hostel_contract.registerStudent("Ada", 19, "Female", "08011111111", "12 Marina Rd", {"from": accounts[1]})
+    hostel_contract.registerStudent("Tunde", 22, "Male", "08022222222", "7 Allen Ave", {"from": accounts[2]})
+    hostel_contract.makePayment({"from": accounts[1], "value": 50000})
+    hostel_contract.makePayment({"from": accounts[2], "value": 60000})
+    assert hostel_contract.getAccruedPayments() == 110000
+    assert hostel_contract.balance() == 110000
+
+    report = reconcile_payments(hostel_contract, batch_size=2)
+    assert report["payments"] == 2
+    assert report["by_student"][accounts[2]] == 60000
+    assert report["balanced"]
+
+    with pytest.raises(Exception):
+        hostel_contract.withdrawPayments({"from": accounts[1]})
+    wallet_before = account.balance()
+    tx = hostel_contract.withdrawPayments({"from": account})
+    assert account.balance() == wallet_before + 110000 - tx.gas_used * tx.gas_price
+    assert tx.events["PaymentsWithdrawn"]["amount"] == 110000
+    assert hostel_contract.getAccruedPayments() == 0
+    assert reconcile_payments(hostel_contract)["balanced"]
+
+
+def test_event_exporter_writes_csv_in_adaptive_chunks(hostel_contract, account, tmp_path):
+    """Test that the exporter writes one CSV per event and shrinks ranges that return too many logs."""
+    for i in range(1, 4):
+        hostel_contract.registerStudent(f"Resident{i}", 20, "Female", "080", "Campus", {"from": accounts[i]})
+        hostel_contract.makePayment({"from": accounts[i], "value": 50000})
+    hostel_contract.vacateRoom({"from": accounts[1]})
+
+    exporter = EventExporter(hostel_contract, out_dir=tmp_path, chunk_size=1000, target_logs=1)
+    counts = exporter.export(from_block=hostel_contract.tx.block_number)
+
+    assert counts == {"RoomBooked": 3, "RoomsBooked": 0, "RoomPaid": 3, "RoomVacated": 1, "databaseUpdated": 0}
+    assert exporter.chunk_size < 1000
+    lines = (tmp_path / "RoomPaid.csv").read_text().splitlines()
+    assert lines[0] == "block_number,tx_hash,log_index,student,studentName,amountPaid"
+    assert lines[1].endswith(f"{accounts[1].address},Resident1,50000")
+
+
+def test_register_student_by_record_hash(hostel_contract, tmp_path):
+    """Test that hashed registration stores no strings on-chain and resolves through the record store."""
+    store = RecordStore(str(tmp_path / "records.db"))
+    record = {"name": "Ada", "gender": "Female", "contact": "08011111111", "address": "12 Marina Rd"}
+    record_hash = store.put(record)
+    # salted: the same details hash differently, and hashing a guess does not match
+    assert store.put(dict(record)) != record_hash
+    assert hash_record(record) != record_hash
+    assert hash_record(store.get(record_hash, include_salt=True)) == record_hash
+    # rows written before salting still resolve
+    with store.db:
+        store.db.execute("INSERT INTO records VALUES (?, ?)", (hash_record(record), canonical_json(record)))
+    assert store.get(hash_record(record)) == record
+
+    hostel_contract.registerStudentRecord(record_hash, 19, {"from": accounts[1]})
+    assert hostel_contract.isResident(accounts[1])
+    assert hostel_contract.occupiedRooms() == 1
+    assert hostel_contract.getStudentDetailsByAddress(accounts[1]) == ("", 19, "", "", "")
+    assert store.get(hostel_contract.getStudentRecordHash(accounts[1])) == record
+
+    updated = dict(record, contact="08099999999")
+    updated_hash = store.put(updated)
+    hostel_contract.updateStudentRecord(updated_hash, 20, {"from": accounts[1]})
+    assert store.get(hostel_contract.getStudentRecordHash(accounts[1])) == updated
+    with pytest.raises(Exception):
+        hostel_contract.registerStudentRecord(record_hash, 19, {"from": accounts[1]})
+
+    indexer = HostelIndexer(hostel_contract, db_path=str(tmp_path / "index.db"))
+    indexer.sync()
+    assert indexer.get_residents() == [accounts[1].address]
+    assert indexer.get_record_hash(accounts[1]) == updated_hash
+    indexer.close()
+    store.close()
+
+
+def test_packed_registration_matches_abi_registration(hostel_contract):
+    """Test that the packed entry points store the same details with less calldata."""
+    args = ("Ada", 19, "Female", "08011111111", "12 Marina Rd")
+    payload = encode_hostel_student(*args)
+    hostel_contract.registerStudentPacked(payload, {"from": accounts[1]})
+    assert hostel_contract.getStudentDetailsByAddress(accounts[1]) == ("Ada", 19, "Female", "08011111111", "12 Marina Rd")
+    assert calldata_size(hostel_contract.registerStudentPacked, payload) < calldata_size(hostel_contract.registerStudent, *args)
+
+    hostel_contract.updateStudentDetailsPacked(encode_hostel_student("Ada O.", 20, "Female", "080", "Yaba"), {"from": accounts[1]})
+    assert hostel_contract.getStudentDetailsByAddress(accounts[1]) == ("Ada O.", 20, "Female", "080", "Yaba")
+    with pytest.raises(Exception):
+        hostel_contract.registerStudentPacked(payload[:-1], {"from": accounts[2]})
+    with pytest.raises(Exception, match="Malformed payload"):
+        hostel_contract.registerStudentPacked(b"", {"from": accounts[2]})
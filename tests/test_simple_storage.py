@@ -1,19 +1,13 @@
-import pytest
-from brownie import SimpleStorage, accounts
-
-
-@pytest.fixture
-def simple_storage():
-    """Deploy a fresh SimpleStorage contract for each test."""
-    account = accounts[0]
-    contract = SimpleStorage.deploy({"from": account})
-    return contract
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 
+import pytest
+from brownie import web3
 
-@pytest.fixture
-def account():
-    """Provide the first account for testing."""
-    return accounts[0]
+from scripts.deploy import iter_favorite_numbers
+from scripts.receipts import ReceiptCollector, get_collector, send
+from scripts.rpc_transport import BatchingHTTPProvider
+from scripts.tx_scanner import scan_contract_transactions
 
 
 def test_initial_favorite_number_is_zero(simple_storage):
@@ -111,3 +105,140 @@ def test_array_preserves_order(simple_storage, account):
     
     # Assert
     assert simple_storage.retrieveAll() == numbers
+
+
+def test_count_and_retrieve_range(simple_storage, account):
+    """Test paging through the stored numbers."""
+    numbers = [5, 10, 15, 20, 25]
+    for number in numbers:
+        simple_storage.store(number, {"from": account})
+
+    assert simple_storage.count() == 5
+    assert simple_storage.retrieveRange(0, 2) == [5, 10]
+    assert simple_storage.retrieveRange(2, 2) == [15, 20]
+    assert simple_storage.retrieveRange(4, 2) == [25]
+    assert simple_storage.retrieveRange(5, 2) == []
+
+
+def test_retrieve_range_large_limit(simple_storage, account):
+    """Test that an oversized limit is clamped to the array length."""
+    simple_storage.store(1, {"from": account})
+    simple_storage.store(2, {"from": account})
+
+    assert simple_storage.retrieveRange(1, 2**256 - 1) == [2]
+
+
+def test_iter_favorite_numbers(simple_storage, account):
+    """Test that the paging generator yields every number in order."""
+    numbers = [3, 1, 4, 1, 5, 9, 2]
+    for number in numbers:
+        simple_storage.store(number, {"from": account})
+
+    assert list(iter_favorite_numbers(simple_storage, page_size=3)) == numbers
+
+
+def test_transaction_scanner_resumes_from_checkpoint(simple_storage, account, tmp_path, monkeypatch):
+    """Test that the scanner finds calls to the contract and only rescans new blocks."""
+    checkpoint = tmp_path / "scanner.json"
+    scanned = []
+    get_block = web3.eth.get_block
+
+    def counting_get_block(number, full_transactions=False):
+        if full_transactions:
+            scanned.append(number)
+        return get_block(number, full_transactions=full_transactions)
+
+    monkeypatch.setattr(web3.eth, "get_block", counting_get_block)
+    for number in (1, 2, 3):
+        simple_storage.store(number, {"from": account})
+
+    deploy_block = simple_storage.tx.block_number
+    matches = scan_contract_transactions(simple_storage.address, from_block=deploy_block, checkpoint_path=checkpoint, chunk_size=2)
+    assert len(matches) == 3
+    assert all(match["selector"] == simple_storage.store.signature for match in matches)
+    assert checkpoint.exists()
+    assert sorted(scanned) == list(range(deploy_block, web3.eth.block_number + 1))
+
+    scanned.clear()
+    head = web3.eth.block_number
+    simple_storage.store(4, {"from": account})
+    matches = scan_contract_transactions(simple_storage.address, from_block=deploy_block, checkpoint_path=checkpoint, chunk_size=2)
+    assert len(matches) == 4
+    assert sorted(scanned) == list(range(head + 1, web3.eth.block_number + 1))
+
+    scanned.clear()
+    later = scan_contract_transactions(simple_storage.address, from_block=matches[-1]["block"], checkpoint_path=checkpoint, chunk_size=2)
+    assert later == matches[-1:]
+    assert scanned == []
+
+
+def test_batching_transport_groups_reads(simple_storage, account):
+    """Test that the batching provider answers batched and concurrent reads correctly."""
+    simple_storage.store(42, {"from": account})
+    provider = BatchingHTTPProvider(web3.provider.endpoint_uri, max_in_flight=1)
+    call = ("eth_call", [{"to": simple_storage.address, "data": simple_storage.retrieve.signature}, "latest"])
+
+    responses = provider.batch([call, ("eth_blockNumber", []), call])
+    assert provider.round_trips == 1
+    assert int(responses[0]["result"], 16) == 42
+    assert int(responses[1]["result"], 16) == web3.eth.block_number
+
+    # hold the only in-flight slot until all 32 reads are queued, so they must share one batch
+    provider._slots.acquire()
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        pending = [executor.submit(provider.make_request, *call) for _ in range(32)]
+        while provider._queue.qsize() < 32:
+            time.sleep(0.01)
+        provider._slots.release()
+        results = [future.result() for future in pending]
+    assert all(int(response["result"], 16) == 42 for response in results)
+    assert provider.requests_sent == 35
+    assert provider.round_trips == 2
+
+
+def test_batching_transport_resolves_every_request_on_batch_error(monkeypatch):
+    """Test that a single error object answering a batch is delivered to every queued request."""
+    class ErrorResponse:
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Batch too large"}}
+
+    provider = BatchingHTTPProvider("http://127.0.0.1:8545")
+    monkeypatch.setattr(provider._session, "post", lambda *args, **kwargs: ErrorResponse())
+    pending = [(provider._encode("eth_blockNumber", []), Future()) for _ in range(3)]
+
+    provider._slots.acquire()
+    provider._send_batch(pending)
+    responses = [future.result(timeout=1) for _, future in pending]
+    assert [response["id"] for response in responses] == [payload["id"] for payload, _ in pending]
+    assert all(response["error"]["message"] == "Batch too large" for response in responses)
+
+
+def test_receipt_collector_returns_receipts_in_submit_order(simple_storage, account):
+    """Test that non-blocking sends resolve, and wait_all returns receipts in the order they were tracked."""
+    collector = ReceiptCollector(max_workers=4)
+    sent = [simple_storage.store(number, {"from": account, "required_confs": 0}) for number in (5, 6, 7)]
+    for tx in sent:
+        collector.track(tx)
+    receipts = collector.wait_all()
+    collector.shutdown()
+
+    assert [receipt.txid for receipt in receipts] == [tx.txid for tx in sent]
+    assert all(receipt.status == 1 for receipt in receipts)
+    assert simple_storage.retrieveAll() == [5, 6, 7]
+
+    future = send(simple_storage.store, 8, tx_params={"from": account}, blocking=False)
+    assert future.result().status == 1
+    assert get_collector().wait_all() == []
+
+
+def test_receipt_collector_propagates_failures(simple_storage, account):
+    """Test that a transaction that fails on-chain surfaces as an exception from its Future."""
+    # too little gas for the storage writes, so the transaction is mined but runs out of gas
+    future = send(simple_storage.store, 1, tx_params={"from": account, "gas_limit": 30000}, blocking=False)
+    assert isinstance(future, Future)
+    with pytest.raises(ValueError, match="reverted"):
+        future.result()
+    assert simple_storage.retrieveAll() == []